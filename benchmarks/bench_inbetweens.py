@@ -0,0 +1,260 @@
+"""
+Headless benchmarks for the In-Betweens add-on.
+
+Usage:
+
+    blender -b --factory-startup --python benchmarks/bench_inbetweens.py -- \\
+        --vertices 20000 --heros 50 --per-hero 5 --frames 250 --output results.json
+
+Builds a synthetic mesh with the requested number of vertices and hero shape keys, then
+times in-between creation (one at a time and, with the legacy API, in batches), activation
+edits, hero renames and their propagation, removal, file save/load and driver evaluation
+over a frame range. Name change notifications are not sent in background mode, so rename
+propagation is timed by calling the add-on's handlers directly. Results are written as JSON so runs of different
+releases can be compared.
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+import addon_utils
+import bpy
+
+
+def parse_args() -> argparse.Namespace:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_inbetweens")
+    parser.add_argument("--addon", default="in_betweens", help="Add-on module name")
+    parser.add_argument("--vertices", type=int, default=10000, help="Approximate vertex count")
+    parser.add_argument("--heros", type=int, default=20, help="Number of hero shape keys")
+    parser.add_argument("--per-hero", type=int, default=3, help="In-betweens per hero")
+    parser.add_argument("--frames", type=int, default=100, help="Frames of driver evaluation")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetitions of each edit benchmark")
+    parser.add_argument("--output", default="", help="JSON output path (stdout if omitted)")
+    return parser.parse_args(argv)
+
+
+class Timings:
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def __call__(self, name: str, count: int=1) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        entry = self.data.setdefault(name, {"total": 0.0, "count": 0})
+        entry["total"] += elapsed
+        entry["count"] += count
+        entry["mean"] = entry["total"] / entry["count"] if entry["count"] else 0.0
+
+    def skip(self, name: str, reason: str) -> None:
+        self.data[name] = {"skipped": reason}
+
+
+def build_mesh(vertices: int, heros: int) -> Tuple[bpy.types.Object, List[str]]:
+    for object in list(bpy.data.objects):
+        bpy.data.objects.remove(object)
+
+    size = max(2, int(math.sqrt(vertices)))
+    verts = [(x / size - 0.5, y / size - 0.5, 0.0) for y in range(size) for x in range(size)]
+    faces = [(y * size + x, y * size + x + 1, (y + 1) * size + x + 1, (y + 1) * size + x)
+             for y in range(size - 1) for x in range(size - 1)]
+
+    mesh = bpy.data.meshes.new("bench")
+    mesh.from_pydata(verts, [], faces)
+    object = bpy.data.objects.new("bench", mesh)
+    bpy.context.scene.collection.objects.link(object)
+    bpy.context.view_layer.objects.active = object
+    object.select_set(True)
+
+    object.shape_key_add(name="Basis", from_mix=False)
+    names = []
+    for index in range(heros):
+        side = ".L" if index % 2 == 0 else ".R"
+        shape = object.shape_key_add(name=f'hero_{index // 2:03d}{side}', from_mix=False)
+        shape.value = 0.5
+        names.append(shape.name)
+
+    return object, names
+
+
+def heros_of(object: bpy.types.Object, names: List[str]) -> List[bpy.types.ShapeKey]:
+    # Resolved from the names recorded by build_mesh since in-betweens share the hero prefix
+    key_blocks = object.data.shape_keys.key_blocks
+    return [key_blocks[name] for name in names]
+
+
+def bench_create(object: bpy.types.Object, names: List[str], per_hero: int, timings: Timings) -> None:
+    key = object.data.shape_keys
+    heros = heros_of(object, names)
+    count = len(heros) * per_hero
+
+    if hasattr(key, "in_betweens"):
+        with timings("InBetweens.new", count):
+            for hero in heros:
+                for index in range(per_hero):
+                    hero.value = (index + 1) / (per_hero + 1)
+                    key.in_betweens.new(hero)
+    else:
+        with timings("NewInBetween", count):
+            for hero in heros:
+                object.active_shape_key_index = key.key_blocks.find(hero.name)
+                for index in range(per_hero):
+                    hero.value = (index + 1) / (per_hero + 1)
+                    bpy.ops.inbetweens.new()
+
+
+def bench_activation(object: bpy.types.Object, addon: str, repeat: int, timings: Timings) -> None:
+    key = object.data.shape_keys
+    if hasattr(key, "in_betweens"):
+        items = list(key.in_betweens)
+        try:
+            deferred = importlib.import_module(f'{addon}.app.scheduler').deferred_updates
+        except (ImportError, AttributeError):
+            deferred = contextlib.nullcontext
+        with timings("activation.edit", len(items) * repeat), deferred():
+            for step in range(repeat):
+                for inbetween in items:
+                    inbetween.activation.target = 0.5 + 0.5 * ((step + 1) % 2)
+    else:
+        entities = [entity for entity in key.asks.entities if 'INBETWEEN' in entity.tags]
+        with timings("activation.edit", len(entities) * repeat):
+            for step in range(repeat):
+                for entity in entities:
+                    entity.components["value"].value = 0.5 + 0.5 * ((step + 1) % 2)
+
+
+def bench_rename(object: bpy.types.Object, addon: str, names: List[str], timings: Timings) -> List[str]:
+    key = object.data.shape_keys
+    heros = heros_of(object, names)
+    if hasattr(key, "in_betweens"):
+        identifiers = [hero.identifier for hero in key.in_betweens.heros]
+
+    with timings("hero.rename", len(heros)):
+        for hero in heros:
+            hero.name = hero.name.replace("hero_", "renamed_")
+
+    if hasattr(key, "in_betweens"):
+        callback = importlib.import_module(f'{addon}.app.bus').shape_key_name_callback
+        pointer = key.as_pointer()
+        with timings("hero.rename.propagate", len(identifiers)):
+            for identifier in identifiers:
+                callback(pointer, identifier)
+    else:
+        rename = sys.modules[addon].inbetween_rename
+        entities = [entity for entity in key.asks.entities if 'INBETWEEN' in entity.tags]
+        with timings("hero.rename.propagate", len(entities)):
+            for entity in entities:
+                components = entity.components
+                rename(entity, components["owner"], components["range"])
+
+    with timings("depsgraph.update"):
+        bpy.context.view_layer.update()
+    return [hero.name for hero in heros]
+
+
+def bench_evaluate(object: bpy.types.Object, names: List[str], frames: int, timings: Timings) -> None:
+    scene = bpy.context.scene
+    for shape in heros_of(object, names):
+        shape.value = 0.0
+        shape.keyframe_insert("value", frame=1)
+        shape.value = 1.0
+        shape.keyframe_insert("value", frame=max(2, frames))
+
+    with timings("driver.evaluate", frames):
+        for frame in range(1, frames + 1):
+            scene.frame_set(frame)
+
+
+def bench_save_load(timings: Timings) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_inbetweens_"), "bench.blend")
+    with timings("file.save"):
+        bpy.ops.wm.save_as_mainfile(filepath=path)
+    with timings("file.load"):
+        bpy.ops.wm.open_mainfile(filepath=path)
+
+
+def bench_remove(object: bpy.types.Object, timings: Timings) -> None:
+    key = object.data.shape_keys
+    if not hasattr(key, "in_betweens"):
+        shapes = [entity.shape().resolve() for entity in key.asks.entities if 'INBETWEEN' in entity.tags]
+        shapes = [shape for shape in shapes if shape is not None]
+        with timings("inbetween.remove", len(shapes)):
+            for shape in shapes:
+                object.shape_key_remove(shape)
+            bpy.context.view_layer.update()
+        return
+
+    inbetweens = key.in_betweens
+    count = len(inbetweens)
+    with timings("InBetweens.remove", count):
+        while len(inbetweens):
+            inbetweens.remove(inbetweens[len(inbetweens) - 1], True)
+
+
+def bench_create_many(object: bpy.types.Object, names: List[str], per_hero: int, timings: Timings) -> None:
+    """Times InBetweens.new_many() creating as many in-betweens as bench_create() does with
+    new(), for comparison. Run after bench_remove() so the Key has no in-betweens left.
+    """
+    key = object.data.shape_keys
+    if not hasattr(key, "in_betweens"):
+        timings.skip("InBetweens.new_many", "no batch creation API in this add-on")
+        return
+
+    heros = heros_of(object, names)
+    centers = [(index + 1) / (per_hero + 1) for index in range(per_hero)]
+    with timings("InBetweens.new_many", len(heros) * per_hero):
+        key.in_betweens.new_many([(hero, centers) for hero in heros])
+
+
+def main() -> Dict[str, Any]:
+    args = parse_args()
+    timings = Timings()
+
+    with timings("addon.enable"):
+        addon_utils.enable(args.addon, default_set=True)
+
+    object, names = build_mesh(args.vertices, args.heros)
+    bench_create(object, names, args.per_hero, timings)
+    bench_activation(object, args.addon, args.repeat, timings)
+    names = bench_rename(object, args.addon, names, timings)
+    bench_evaluate(object, names, args.frames, timings)
+    bench_save_load(timings)
+    object = bpy.data.objects["bench"]
+    bench_remove(object, timings)
+    bench_create_many(object, names, args.per_hero, timings)
+
+    module = sys.modules.get(args.addon)
+    return {
+        "blender": bpy.app.version_string,
+        "addon": ".".join(map(str, getattr(module, "bl_info", {}).get("version", ()))),
+        "params": {
+            "vertices": len(bpy.data.objects["bench"].data.vertices),
+            "heros": args.heros,
+            "per_hero": args.per_hero,
+            "frames": args.frames,
+            "repeat": args.repeat,
+            },
+        "timings": timings.data,
+        }
+
+
+if __name__ == "__main__":
+    results = main()
+    text = json.dumps(results, indent=2, sort_keys=True)
+    output = parse_args().output
+    if output:
+        with open(output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
@@ -0,0 +1,103 @@
+"""
+Startup benchmark for the In-Betweens add-on.
+
+Usage:
+
+    blender -b --factory-startup --python benchmarks/bench_startup.py -- \\
+        --repeat 10 --output startup.json
+
+Times importing, registering and unregistering the add-on. The first round is reported
+separately as "cold" since it includes importing dependencies (e.g. NumPy) not yet loaded by
+Blender. Later rounds drop the add-on's modules from sys.modules before importing again.
+The submodules loaded by import and register are listed so eager imports are easy to spot.
+Run without -b to include the UI classes that are skipped in background mode.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from typing import Any, Dict, List
+import bpy
+
+
+def parse_args() -> argparse.Namespace:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_startup")
+    parser.add_argument("--addon", default="in_betweens", help="Add-on module name")
+    parser.add_argument("--repeat", type=int, default=5, help="Warm import/register rounds")
+    parser.add_argument("--output", default="", help="JSON output path (stdout if omitted)")
+    return parser.parse_args(argv)
+
+
+def addon_modules(addon: str) -> List[str]:
+    return sorted(name for name in sys.modules if name == addon or name.startswith(f'{addon}.'))
+
+
+def purge(addon: str) -> None:
+    for name in addon_modules(addon):
+        del sys.modules[name]
+
+
+def measure(addon: str) -> Dict[str, Any]:
+    purge(addon)
+    before = set(sys.modules)
+
+    start = time.perf_counter()
+    module = importlib.import_module(addon)
+    imported = time.perf_counter() - start
+    after_import = set(sys.modules)
+
+    start = time.perf_counter()
+    module.register()
+    registered = time.perf_counter() - start
+    after_register = set(sys.modules)
+
+    start = time.perf_counter()
+    module.unregister()
+    unregistered = time.perf_counter() - start
+
+    return {
+        "import": imported,
+        "register": registered,
+        "unregister": unregistered,
+        "modules_import": sorted(after_import - before),
+        "modules_register": sorted(after_register - after_import),
+        }
+
+
+def summarize(rounds: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    result = {}
+    for name in ("import", "register", "unregister"):
+        values = sorted(item[name] for item in rounds)
+        result[name] = {
+            "min": values[0],
+            "median": values[len(values) // 2],
+            "max": values[-1],
+            }
+    return result
+
+
+def main() -> Dict[str, Any]:
+    args = parse_args()
+    cold = measure(args.addon)
+    warm = [measure(args.addon) for _ in range(max(1, args.repeat))]
+    return {
+        "blender": bpy.app.version_string,
+        "background": bpy.app.background,
+        "cold": cold,
+        "warm": summarize(warm),
+        "modules": addon_modules(args.addon),
+        }
+
+
+if __name__ == "__main__":
+    results = main()
+    text = json.dumps(results, indent=2, sort_keys=True)
+    output = parse_args().output
+    if output:
+        with open(output, "w") as file:
+            file.write(text)
+    else:
+        print(text)
@@ -2,8 +2,11 @@
 from typing import TYPE_CHECKING, Tuple
 from bpy.types import PropertyGroup
 from bpy.props import FloatProperty
-from in_betweens.lib.symmetry import symmetrical_split
 from ..lib.curve_mapping import BCLMAP_CurveManager
+from ..app.driver_index import driver_index_invalidate
+from ..app.rows import inbetween_rows_invalidate
+from ..app.scheduler import schedule_update
+from ..app.utils import symmetrical_split_cached
 if TYPE_CHECKING:
     from .in_between import InBetween
 
@@ -21,7 +24,7 @@ def activation_range_min_set(activation: 'InBetweenActivation', value: float) ->
         if rmax <= rmin + 0.1:
             rmax = rmin + 0.1
             activation["range_max"] = rmax
-        activation.in_between.update()
+        schedule_update(activation.in_between)
 
 
 def activation_range_max(activation: 'InBetweenActivation') -> float:
@@ -37,7 +40,7 @@ def activation_range_max_set(activation: 'InBetweenActivation', value: float) ->
         if rmin >= rmax - 0.1:
             rmin = rmax - 0.1
             activation["range_min"] = rmin
-        activation.in_between.update()
+        schedule_update(activation.in_between)
 
 
 def activation_center(activation: 'InBetweenActivation') -> float:
@@ -53,16 +56,18 @@ def activation_center_set(activation: 'InBetweenActivation', value: float) -> No
     cval = min(max(rmin + 0.1, value), rmax - 0.1)
     if cval != activation.center:
         activation["center"] = cval
+        inbetween_rows_invalidate(activation.id_data)
         ibtw = activation.in_between
         hero = ibtw.hero
-        pfix, base, sfix = symmetrical_split(hero.name)
+        pfix, base, sfix = symmetrical_split_cached(hero.name)
         ibkb = ibtw.id_data.key_blocks.get(ibtw.name)
         if ibkb is not None:
             ibkb.name = f'{pfix}{base}_{cval:.3f}{sfix}'
+            driver_index_invalidate(ibkb.id_data)
 
 
 def activation_target_update_handler(activation: 'InBetweenActivation', _) -> None:
-    activation.in_between.update()
+    schedule_update(activation.in_between)
 
 
 class InBetweenActivation(BCLMAP_CurveManager, PropertyGroup):
@@ -120,4 +125,4 @@ class InBetweenActivation(BCLMAP_CurveManager, PropertyGroup):
 
     def update(self) -> None:
         super().update()
-        self.in_between.update()
+        schedule_update(self.in_between)
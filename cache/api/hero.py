@@ -1,17 +1,25 @@
 
 from typing import List, TYPE_CHECKING
 from bpy.types import PropertyGroup
+from bpy.props import IntProperty
 from ..lib.asks import ASKSComponent
+from ..app.index import inbetween_index_lookup
 if TYPE_CHECKING:
     from bpy.types import ShapeKey
     from .in_between import InBetween
 
 class InBetweenHero(ASKSComponent, PropertyGroup):
 
+    active_index: IntProperty(
+        name="Active In-Between",
+        description="Index of the in-between highlighted in the hero's in-between list",
+        default=0,
+        options=set()
+        )
+
     @property
     def in_betweens(self) -> List['InBetween']:
-        id = self.identifier
-        return [x for x in self.id_data.in_betweens if x.get("hero", "") == id]
+        return inbetween_index_lookup(self.id_data.in_betweens, self.identifier)
 
     def __init__(self, shape: 'ShapeKey') -> None:
         self["name"] = shape.name
\ No newline at end of file
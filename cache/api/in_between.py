@@ -3,8 +3,12 @@ from typing import Optional, TYPE_CHECKING, Tuple
 from bpy.types import PropertyGroup
 from bpy.props import BoolProperty, PointerProperty
 from ..lib.asks import ASKSComponent
-from ..lib.driver_utils import driver_ensure, driver_find
-from ..lib.curve_mapping import keyframe_points_assign, to_bezier
+from ..lib.driver_utils import driver_ensure
+from ..app.curves import to_bezier_cached
+from ..app.driver_index import driver_index_find
+from ..app.keyframes import keyframe_points_sync
+from ..app.rows import inbetween_rows_invalidate
+from ..lib.curve_mapping import to_bezier
 from .activation import InBetweenActivation
 if TYPE_CHECKING:
     from .hero import InBetweenHero
@@ -15,7 +19,7 @@ def inbetween_is_valid(inbetween: 'InBetween') -> bool:
 
 
 def inbetween_mute_update_handler(inbetween: 'InBetween', _) -> None:
-    fc = driver_find(inbetween.id_data, f'key_blocks["{inbetween.name}"].value')
+    fc = driver_index_find(inbetween.id_data, f'key_blocks["{inbetween.name}"].value')
     if fc:
         fc.mute = inbetween.mute
 
@@ -59,13 +63,16 @@ class InBetween(ASKSComponent, PropertyGroup):
         
 
     def update(self) -> None:
+        inbetween_rows_invalidate(self.id_data)
+
         fc = driver_ensure(self.id_data, f'key_blocks["{self.name}"].value')
         fc.mute = self.mute
 
         act = self.activation
-        pts = to_bezier(act.curve.points,
-                        x_range=(act.range_min, act.range_max),
-                        y_range=(0.0, act.target),
-                        extrapolate=False)
-    
-        keyframe_points_assign(fc.keyframe_points, pts)
+        curve = act.curve.points
+        pts = to_bezier_cached(curve,
+                               lambda x, y: to_bezier(curve, x_range=x, y_range=y, extrapolate=False),
+                               range_x=(act.range_min, act.range_max),
+                               range_y=(0.0, act.target))
+
+        keyframe_points_sync(fc, pts)
@@ -1,13 +1,20 @@
 
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 from bpy.types import Object, PropertyGroup, ShapeKey
 from bpy.props import CollectionProperty, IntProperty, PointerProperty
 from in_betweens.app.drivers import inbetween_value_driver_init
 from in_betweens.lib.driver_utils import driver_ensure, driver_remove
-from in_betweens.lib.symmetry import symmetrical_split
-from in_betweens.ops.base import COMPAT_OBJECTS
 from ..lib.asks import ASKSNamespace, add_proxy_variable
-from ..app.utils import inbetween_name_format
+from ..app.bus import key_ensure, subscribe_hero, subscribe_inbetween, unsubscribe
+from ..app.curves import curve_points_assign, curve_points_data
+from ..app.driver_index import driver_index_invalidate
+from ..app.index import inbetween_index_add, inbetween_index_discard, inbetween_index_lookup
+from ..app.mirror import mirror_map, shape_key_mirror
+from ..app.owners import key_owner
+from ..app.reorder import shape_key_reorder
+from ..app.rows import inbetween_rows_invalidate
+from ..app.shapes import shape_key_coordinates, shape_key_seed
+from ..app.utils import inbetween_name_format, symmetrical_flip, symmetrical_side
 from .hero import InBetweenHero
 from .heros import InBetweenHeros
 from .in_between import InBetween
@@ -29,44 +36,29 @@ class InBetweens(ASKSNamespace, PropertyGroup):
 
     def __getitem__(self, key: Union[int, str, slice, 'ShapeKey', InBetweenHero]) -> Union[InBetween, List[InBetween]]:
         if isinstance(key, InBetweenHero):
-            res = []
-            hid = key.identifier
-            for ibtw in self:
-                if ibtw.get("hero", "") == hid:
-                    res.append(ibtw)
-            return res
+            return inbetween_index_lookup(self, key.identifier)
         return super()[key]
 
-    def new(self, hero: ShapeKey, shape: Optional[ShapeKey]=None) -> InBetween:
-
-        if not isinstance(hero, ShapeKey):
-            raise TypeError((f'{self.__class__.__name__}.new(hero, shape=None): '
-                             f'Expected hero to be ShapeKey, not {hero.__class__.__name__}'))
-
-        if shape is not None and not isinstance(shape, ShapeKey):
-            raise TypeError((f'{self.__class__.__name__}.new(hero, shape=None): '
-                             f'Expected shape to be ShapeKey, not {shape.__class__.__name__}'))
-
-        if hero.id_data != self.id_data:
-            raise TypeError((f'{self.__class__.__name__}.new(hero, shape=None): '
-                             f'hero is from another Key'))
-
-        key = self.id_data
-
-        import bpy
-        for object in bpy.data.objects:
-            if object.type in COMPAT_OBJECTS and object.data == key.user: break
-
+    def _hero_identifier(self, hero: ShapeKey, notifications: List[Tuple[tuple, dict]]) -> str:
         heros = self.heros
-
         if hero in heros:
-            hero_id = heros[hero].identifier
-        else:
-            _hero = heros.collection__internal__.add()
-            _hero["name"] = hero.name
-            hero_id = _hero.identifier
-            key.asks.notify('INBETWEENS::HERO_CREATED', hero.name)
-        
+            return heros[hero].identifier
+
+        _hero = heros.collection__internal__.add()
+        _hero["name"] = hero.name
+        subscribe_hero(_hero)
+        notifications.append((('INBETWEENS::HERO_CREATED', hero.name), {}))
+        return _hero.identifier
+
+    def _create(self,
+                object: Object,
+                hero: ShapeKey,
+                hero_id: str,
+                center: Optional[float]=None,
+                target: Optional[float]=1.0,
+                shape: Optional[ShapeKey]=None,
+                seed: Optional[str]='BASIS') -> InBetween:
+
         range_min = hero.slider_min
         range_max = hero.slider_max
         range_dif = (range_max - range_min) * 0.5
@@ -75,50 +67,268 @@ class InBetweens(ASKSNamespace, PropertyGroup):
             range_min -= 0.1 - range_dif
             range_max += 0.1 - range_dif
 
-        center = hero.value
-        center = center if center - range_min >= 0.1 else range_min + range_dif
+        if center is None:
+            center = hero.value
+            center = center if center - range_min >= 0.1 else range_min + range_dif
+        else:
+            center = min(max(range_min + 0.1, center), range_max - 0.1)
 
         name = inbetween_name_format(hero.name, center)
 
         if shape is None:
-            shape = object.shape_key_add(name=name, from_mix=False)
+            shape = object.shape_key_add(name=name, from_mix=seed == 'MIX')
+            if seed == 'HERO':
+                shape_key_seed(shape, hero, center)
         else:
             # TODO diff shape with hero
             shape.name = name
         
         inbetween: 'InBetween' = self.collection__internal__.add()
         inbetween["hero"] = hero_id
-        inbetween["name"] = name
+        inbetween["name"] = shape.name
+        inbetween_index_add(self, inbetween)
+        subscribe_inbetween(inbetween)
 
         inbetween_value_driver_init(inbetween, hero.name)
 
         activation = inbetween.activation
         activation["center"] = center
-        activation["target"] = 1.0
+        activation["target"] = target
         activation["range_min"] = range_min
         activation["range_max"] = range_max
         #TODO move to curve_mapping utility function
         activation.__init__(type='BELL', ramp='HEAD', interpolation='QUAD', easing='EASE_IN_OUT')
 
         inbetween.update()
+        return inbetween
+
+    def _reorder(self, object: Object, placed: List[Tuple[str, str]]) -> None:
+        shapes = self.id_data.key_blocks
+        names = shapes.keys()
+
+        groups = {}
+        for name, heroname in placed:
+            groups.setdefault(heroname, []).append(name)
+
+        moved = {name for name, _ in placed}
+        order = []
+        for name in names:
+            if name not in moved:
+                order.append(name)
+                order.extend(groups.get(name, ()))
 
-        shapes = key.key_blocks
-        a_index = object.active_shape_key_index
-        i_index = shapes.find(inbetween.name)
-        h_index = shapes.find(hero.name)
-        offset = i_index - h_index - 1
+        shape_key_reorder(object, order)
 
-        object.active_shape_key_index = i_index
+    def new(self, hero: ShapeKey, shape: Optional[ShapeKey]=None, seed: Optional[str]='BASIS') -> InBetween:
+        """Creates an in-between for hero. Unless an existing shape is given, a new shape key
+        is added starting from seed: a copy of the basis ('BASIS'), the hero's delta scaled to
+        the activation center ('HERO') or the current mix ('MIX').
+        """
 
-        while offset:
-            bpy.ops.object.shape_key_move(type='UP')
-            offset -= 1
+        if not isinstance(hero, ShapeKey):
+            raise TypeError((f'{self.__class__.__name__}.new(hero, shape=None): '
+                             f'Expected hero to be ShapeKey, not {hero.__class__.__name__}'))
 
-        object.active_shape_key_index = a_index
+        if shape is not None and not isinstance(shape, ShapeKey):
+            raise TypeError((f'{self.__class__.__name__}.new(hero, shape=None): '
+                             f'Expected shape to be ShapeKey, not {shape.__class__.__name__}'))
 
-        key.asks.notify('INBETWEENS::INBETWEEN_CREATED', shape.name, hero=hero.name)
+        if hero.id_data != self.id_data:
+            raise TypeError((f'{self.__class__.__name__}.new(hero, shape=None): '
+                             f'hero is from another Key'))
+
+        key = self.id_data
+
+        object = key_owner(key)
+        if object is None:
+            raise ValueError((f'{self.__class__.__name__}.new(hero, shape=None): '
+                              f'{key.name} is not used by any object'))
+
+        notifications = []
+        hero_id = self._hero_identifier(hero, notifications)
+        for args, kwargs in notifications:
+            key.asks.notify(*args, **kwargs)
+
+        inbetween = self._create(object, hero, hero_id, shape=shape, seed=seed)
+
+        self._reorder(object, [(inbetween.name, hero.name)])
+
+        key.asks.notify('INBETWEENS::INBETWEEN_CREATED', inbetween.name, hero=hero.name)
         return inbetween
 
+    def new_many(self,
+                 hero: Union[ShapeKey, Iterable[Tuple[ShapeKey, Sequence[Union[float, Tuple[float, float]]]]]],
+                 centers: Optional[Sequence[Union[float, Tuple[float, float]]]]=None,
+                 seed: Optional[str]='BASIS') -> List[InBetween]:
+        """Creates in-betweens for each activation center in a single pass.
+
+        Accepts either a hero and a sequence of centers, or a sequence of (hero, centers)
+        pairs. Each center is either a float or a (center, target) pair. Shape keys are
+        reordered once and notifications are sent after all in-betweens are created. New
+        shape keys start from seed (see new()).
+        """
+        if isinstance(hero, ShapeKey):
+            if centers is None:
+                raise TypeError((f'{self.__class__.__name__}.new_many(hero, centers): '
+                                 f'Expected centers to be a sequence, not None'))
+            items = [(hero, centers)]
+        else:
+            items = list(hero)
+
+        key = self.id_data
+
+        for item, _ in items:
+            if not isinstance(item, ShapeKey):
+                raise TypeError((f'{self.__class__.__name__}.new_many(hero, centers): '
+                                 f'Expected hero to be ShapeKey, not {item.__class__.__name__}'))
+            if item.id_data != key:
+                raise TypeError((f'{self.__class__.__name__}.new_many(hero, centers): '
+                                 f'hero is from another Key'))
+
+        if not items:
+            return []
+
+        object = key_owner(key)
+        if object is None:
+            raise ValueError((f'{self.__class__.__name__}.new_many(hero, centers): '
+                              f'{key.name} is not used by any object'))
+
+        data = self.collection__internal__
+        first = len(data)
+        notifications = []
+        placed = []
+
+        for item, values in items:
+            hero_id = self._hero_identifier(item, notifications)
+            for value in values:
+                center, target = value if isinstance(value, tuple) else (value, 1.0)
+                name = self._create(object, item, hero_id, center=center, target=target, seed=seed).name
+                placed.append((name, item.name))
+                notifications.append((('INBETWEENS::INBETWEEN_CREATED', name), {"hero": item.name}))
+
+        self._reorder(object, placed)
+
+        for args, kwargs in notifications:
+            key.asks.notify(*args, **kwargs)
+
+        return list(data[first:])
+
+    def mirror(self, side: Optional[str]='L', shapes: Optional[bool]=True) -> Tuple[int, int]:
+        """Creates or updates the in-betweens of the opposite side's hero for every hero on
+        the given side ('L' or 'R') in a single pass, copying activation range, center,
+        target and curve. An existing in-between is updated when its center matches. If
+        shapes is True the shape deltas of mesh in-betweens are mirrored across the X axis.
+        Returns the number of in-betweens created and updated.
+        """
+        if side not in ('L', 'R'):
+            raise ValueError((f'{self.__class__.__name__}.mirror(side="L", shapes=True): '
+                              f'Expected side to be "L" or "R", not {side}'))
+
+        key = self.id_data
+        key_ensure(key)
+
+        object = key_owner(key)
+        if object is None:
+            raise ValueError((f'{self.__class__.__name__}.mirror(side="L", shapes=True): '
+                              f'{key.name} is not used by any object'))
+
+        blocks = key.key_blocks
+        heros = self.heros
+        pairs = []
+        create = []
+
+        for hero in heros:
+            name = hero.name
+            if symmetrical_side(name) != side:
+                continue
+
+            other = blocks.get(symmetrical_flip(name))
+            if other is None:
+                continue
+
+            existing = self[heros[other]] if other in heros else []
+            centers = [(inbetween.activation.center, inbetween.name) for inbetween in existing]
+            queued = []
+
+            for inbetween in self[hero]:
+                center = inbetween.activation.center
+                match = min(centers, key=lambda item: abs(item[0] - center), default=None)
+                if match is not None and abs(match[0] - center) < 0.001:
+                    centers.remove(match)
+                    pairs.append((inbetween.name, match[1]))
+                else:
+                    queued.append(inbetween.name)
+
+            if queued:
+                create.append((other, queued))
+
+        updated = len(pairs)
+        data = self.collection__internal__
+
+        if create:
+            items = [(other, [(data[name].activation.center, data[name].activation.target) for name in names])
+                     for other, names in create]
+            created = [inbetween.name for inbetween in self.new_many(items)]
+            pairs.extend(zip((name for _, names in create for name in names), created))
+
+        for source, target in pairs:
+            src = data[source].activation
+            dst = data[target].activation
+            dst["range_min"] = src.range_min
+            dst["range_max"] = src.range_max
+            dst["center"] = src.center
+            dst["target"] = src.target
+            curve_points_assign(dst.curve.points, curve_points_data(src.curve.points))
+            data[target].update()
+
+        if shapes and pairs and object.type == 'MESH':
+            basis = shape_key_coordinates(key.reference_key)
+            lookup = mirror_map(basis)
+            for source, target in pairs:
+                shape = blocks.get(target)
+                if shape is not None and source in blocks:
+                    shape_key_mirror(blocks[source], shape, basis, lookup)
+
+        if pairs:
+            key.asks.notify('INBETWEENS::INBETWEENS_MIRRORED', names=tuple(pairs))
+
+        return len(pairs) - updated, updated
+
+    def regroup(self) -> int:
+        """Moves every in-between shape key directly below its hero, ordered by activation
+        center, in a single pass. Returns the number of shape key moves made.
+        """
+        key = self.id_data
+
+        object = key_owner(key)
+        if object is None:
+            raise ValueError((f'{self.__class__.__name__}.regroup(): '
+                              f'{key.name} is not used by any object'))
+
+        # In-betweens of heros whose shape key is missing are left where they are
+        heros = {}
+        for hero in self.heros:
+            if hero.name in key.key_blocks:
+                heros[hero.identifier] = hero.name
+
+        groups = {}
+        for inbetween in self.collection__internal__:
+            heroname = heros.get(inbetween.get("hero", ""))
+            if heroname is not None and inbetween.name in key.key_blocks:
+                groups.setdefault(heroname, []).append((inbetween.activation.center, inbetween.name))
+
+        moved = {name for items in groups.values() for _, name in items}
+        order = []
+        for name in key.key_blocks.keys():
+            if name not in moved:
+                order.append(name)
+                order.extend(name for _, name in sorted(groups.get(name, ())))
+
+        if len(order) != len(key.key_blocks):
+            return 0
+
+        return shape_key_reorder(object, order)
+
     def remove(self, inbetween: InBetween, remove_shape_key: Optional[bool]=False) -> None:
         
         if not isinstance(inbetween, InBetween):
@@ -126,37 +336,40 @@ class InBetweens(ASKSNamespace, PropertyGroup):
                              f'Expected inbetween to be InBetween, not {inbetween.__class__.__name__}'))
 
         key = self.id_data
+        key_ensure(key)
 
         if inbetween.id_data != key:
             raise ValueError((f'{self.__class__.__name__}.remove(inbetween, remove_shape_key=False): '
                              f'inbetween is not a member of this collection'))
 
         hero = inbetween.hero
+        hname = hero.name if hero is not None else ""
         data = self.collection__internal__
         name = inbetween.name
 
-        key.asks.notify('INBETWEENS::INBETWEEN_DISPOSE', name, hero=hero.name)
+        key.asks.notify('INBETWEENS::INBETWEEN_DISPOSE', name, hero=hname)
         driver_remove(key, f'key_blocks["{name}"].value')
+        driver_index_invalidate(key)
+        identifier = inbetween.identifier
         data.remove(data.find(name))
-        key.asks.notify('INBETWEENS::INBETWEEN_REMOVED', name, hero=hero.name)
+        inbetween_index_discard(self, identifier)
+        inbetween_rows_invalidate(key)
+        unsubscribe(key, identifier)
+        key.asks.notify('INBETWEENS::INBETWEEN_REMOVED', name, hero=hname)
 
-        if len(hero.in_betweens) == 0:
-            hname = hero.name
+        if hero is not None and len(hero.in_betweens) == 0:
             key.asks.notify("INBETWEENS::HERO_DISPOSE", hname)
             heros = self.heros
+            unsubscribe(key, hero.identifier)
             heros.collection__internal__.remove(heros.find(hname))
             key.asks.notify("INBETWEENS::HERO_REMOVED", hname)
 
         if remove_shape_key:
-            import bpy
-            usr = key.user
-            for obj in bpy.data.objects:
-                if obj.type in COMPAT_OBJECTS and obj.data == usr: break
-
+            obj = key_owner(key)
             kbs = key.key_blocks
             idx = kbs.find(name)
 
-            if idx >= 0:
+            if obj is not None and idx >= 0:
                 key.asks.notify("INBETWEENS::SHAPEKEY_DISPOSE", name)
                 obj.shape_key_remove(kbs[idx])
                 key.asks.notify("INBETWEENS::SHAPEKEY_REMOVED", name)
@@ -1,71 +1,242 @@
 
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 import bpy
-from ..lib.symmetry import symmetrical_split
+from .driver_index import PROXY_VARIABLE_PREFIX, driver_index, driver_index_find_variable
+from .index import inbetween_index
+from .drivers import HERO_VALUE_VARIABLE_NAME, proxy_variable_name
+from .rename import RenameTransaction, rename_suppressed, rename_transactions_clear
+from .stats import instrumented
+from .utils import inbetween_name_format, symmetrical_split_cached
 if TYPE_CHECKING:
-    from bpy.types import AnimData, Key
+    from bpy.types import Key
+    from ..api.hero import InBetweenHero
     from ..api.in_between import InBetween
-    from ..api.in_betweens import InBetweens
 
-MESSAGE_BROKER = object()
+WARM_INTERVAL = 0.5
+WARM_BATCH = 4
 
-def datamap(key: 'Key') -> Dict[str, Tuple['InBetween', 'InBetweens']]:
-    data = {}
-    for hero in key.in_betweens:
-        for item in hero:
-            data[item.identifier] = (item, hero)
+_owners: Dict[int, object] = {}
+_datamaps: Dict[int, Dict[str, str]] = {}
+_deferred: Set[int] = set()
+
+
+def datamap(key: 'Key') -> Dict[str, str]:
+    """Maps the identifier of each hero and in-between on the Key to its hero's identifier"""
+    pointer = key.as_pointer()
+    data = _datamaps.get(pointer)
+    if data is None:
+        data = _datamaps[pointer] = {}
+        inbetweens = key.in_betweens
+        for hero in inbetweens.heros:
+            data[hero.identifier] = hero.identifier
+        for item in inbetweens:
+            data[item.identifier] = item.get("hero", "")
     return data
 
 
-def changelog(animdata: 'AnimData',
-              data: Dict[str, Tuple['InBetween', 'InBetweens']]
-              ) -> Dict['InBetweens', List['InBetween']]:
-    clog = {}
-    for fc in animdata.drivers:
-        vars = fc.driver.variables
-        if len(vars) == 2:
-            k = vars[0].name
-            if k.startswith("inbetween_") and k in data:
-                item, hero = data[k]
-                item_name = item["name"] = fc.data_path[12:-8]
-                hero_name = hero["name"] = vars[1].targets[0].data_path[12:-8]
+def sync_names(key: 'Key', hero: 'InBetweenHero', items: List['InBetween']) -> None:
+    for item in items:
+        fc = driver_index_find_variable(key, proxy_variable_name(item))
+        if fc is not None:
+            item["name"] = fc.data_path[12:-8]
+            var = fc.driver.variables.get(HERO_VALUE_VARIABLE_NAME)
+            if var is not None:
+                hero["name"] = var.targets[0].data_path[12:-8]
+
+
+def sync_key_names(key: 'Key') -> None:
+    """Re-reads the names of every hero and in-between on the Key from their drivers, whose
+    paths Blender rewrites when a key block is renamed. Name change notifications do this
+    as renames happen but are not sent in background mode.
+    """
+    inbetweens = key.in_betweens
+    heros = {hero.identifier: hero for hero in inbetweens.heros.collection__internal__}
+    groups: Dict[str, List['InBetween']] = {}
+    for item in inbetweens.collection__internal__:
+        groups.setdefault(item.get("hero", ""), []).append(item)
+    for hero_id, items in groups.items():
+        hero = heros.get(hero_id)
+        if hero is not None:
+            sync_names(key, hero, items)
+
 
-                hpfix, hbase, hsfix = symmetrical_split(hero_name)
-                ipfix, ibase, isfix = symmetrical_split(item_name)
+def rename_plan(key: 'Key',
+                hero: 'InBetweenHero',
+                items: List['InBetween']) -> Tuple[Dict[str, Tuple['InBetween', str]], Dict[str, str]]:
+    """Computes the final names of the hero's in-betweens whose names no longer follow the
+    hero's. Returns a dict mapping current names to (in-between, final name) and a dict
+    mapping the current names left unchanged because their final name is taken to it.
+    """
+    hpfix, hbase, hsfix = symmetrical_split_cached(hero.name)
+    kbs = key.key_blocks
+    renames = {}
+
+    for item in items:
+        name = item.name
+        if name in kbs:
+            ipfix, ibase, isfix = symmetrical_split_cached(name)
+            if not ibase.startswith(hbase) or ipfix != hpfix or isfix != hsfix:
+                final = inbetween_name_format(hero.name, item.activation.center)
+                if final != name:
+                    renames[name] = (item, final)
+
+    taken = set(kbs.keys()).difference(renames)
+    plan = {}
+    conflicts = {}
 
-                if not ibase.startswith(hbase) or ipfix != hpfix or isfix != hsfix:
-                    clog.setdefault(hero, []).append(item)
-    return clog
+    for name, (item, final) in renames.items():
+        if final in taken:
+            conflicts[name] = final
+        else:
+            taken.add(final)
+            plan[name] = (item, final)
 
+    return plan, conflicts
 
-def update_shape_key_names(key: 'Key', clog: Dict[str, Tuple['InBetween', 'InBetweens']]) -> None:
+
+def apply_rename_plan(key: 'Key',
+                      hero: 'InBetweenHero',
+                      plan: Dict[str, Tuple['InBetween', str]],
+                      conflicts: Dict[str, str]) -> None:
     kbs = key.key_blocks
-    for hero, items in clog.items():
-        pfix, base, sfix = symmetrical_split(hero.name)
-        for item in items:
-            kb = kbs.get(item.name)
-            if kb is not None:
-                kb.name = item["name"] = f'{pfix}{base}_{item.activation_value:.3f}{sfix}'
+    with RenameTransaction(key, hero.name) as transaction:
+        for name, (item, final) in plan.items():
+            transaction.rename(item, kbs[name], final)
+        for name, final in conflicts.items():
+            transaction.conflict(name, final)
 
 
-def shape_key_name_callback():
+def key_from_pointer(pointer: int) -> Optional['Key']:
+    """Returns the Key with the given as_pointer() value. Subscriptions pass pointers rather
+    than names so that they survive the Key being renamed.
+    """
     for key in bpy.data.shape_keys:
-        if key.is_property_set("in_betweens"):
-            animdata = key.animation_data
-            if animdata:
-                data = datamap(key)
-                if data:
-                    clog = changelog(animdata, data)
-                    while clog:
-                        update_shape_key_names(key, clog)
-                        clog = changelog(animdata, data)
-                        
+        if key.as_pointer() == pointer:
+            return key
+
+
+@instrumented
+def shape_key_name_callback(pointer: int, identifier: str) -> None:
+    key = key_from_pointer(pointer)
+    if key is None or not key.is_property_set("in_betweens") or key.animation_data is None:
+        return
+
+    fc = driver_index_find_variable(key, f'{PROXY_VARIABLE_PREFIX}{identifier}')
+    if fc is not None and rename_suppressed(pointer, identifier, fc.data_path[12:-8]):
+        return
+
+    hero = key.in_betweens.heros.search(datamap(key).get(identifier, ""))
+    if hero is None:
+        return
+
+    items = hero.in_betweens
+    sync_names(key, hero, items)
+    plan, conflicts = rename_plan(key, hero, items)
+    if plan or conflicts:
+        apply_rename_plan(key, hero, plan, conflicts)
+
+
+def subscribe(key: 'Key', name: str, identifier: str, hero_id: str) -> None:
+    key_ensure(key)
+    shape = key.key_blocks.get(name)
+    if shape is not None:
+        datamap(key)[identifier] = hero_id
+        bpy.msgbus.subscribe_rna(key=shape.path_resolve("name", False),
+                                 owner=_owners.setdefault(key.as_pointer(), object()),
+                                 args=(key.as_pointer(), identifier),
+                                 notify=shape_key_name_callback)
+
+
+def subscribe_hero(hero: 'InBetweenHero') -> None:
+    subscribe(hero.id_data, hero.name, hero.identifier, hero.identifier)
+
+
+def subscribe_inbetween(inbetween: 'InBetween') -> None:
+    subscribe(inbetween.id_data, inbetween.name, inbetween.identifier, inbetween.get("hero", ""))
+
+
+@instrumented
+def subscribe_key(key: 'Key') -> None:
+    pointer = key.as_pointer()
+    _deferred.discard(pointer)
+    owner = _owners.pop(pointer, None)
+    if owner is not None:
+        bpy.msgbus.clear_by_owner(owner)
+    _datamaps.pop(pointer, None)
+
+    inbetweens = key.in_betweens
+    for hero in inbetweens.heros:
+        subscribe_hero(hero)
+    for item in inbetweens:
+        subscribe_inbetween(item)
+
+
+def unsubscribe(key: 'Key', identifier: str) -> None:
+    """Forgets a removed hero or in-between. Its message bus subscription is released with
+    the Key's next resubscription and ignores notifications until then.
+    """
+    data = _datamaps.get(key.as_pointer())
+    if data is not None:
+        data.pop(identifier, None)
+
+
+def subscriptions_stale(key: 'Key', identifiers: Set[str]) -> bool:
+    """Returns True if the Key's name subscriptions include identifiers not in identifiers"""
+    data = _datamaps.get(key.as_pointer())
+    return data is not None and not identifiers.issuperset(data)
+
+
+def owners_stale(pointers: Set[int]) -> List[int]:
+    """Returns the subscription owners for Keys whose pointers are not in pointers"""
+    return [pointer for pointer in _owners if pointer not in pointers]
+
+
+def owners_release(pointers: Iterable[int]) -> None:
+    for pointer in pointers:
+        owner = _owners.pop(pointer, None)
+        if owner is not None:
+            bpy.msgbus.clear_by_owner(owner)
+        _datamaps.pop(pointer, None)
+
+
+def key_ensure(key: 'Key') -> None:
+    """Subscribes the Key to name updates if that was deferred when the file was loaded.
+    Call before the Key's in-betweens are edited or drawn.
+    """
+    if _deferred and key.as_pointer() in _deferred:
+        subscribe_key(key)
+
+
+@instrumented
+def warm_timer() -> Optional[float]:
+    """Subscribes and indexes a few deferred Keys per tick until none remain"""
+    count = 0
+    keys = {key.as_pointer(): key for key in bpy.data.shape_keys}
+    while _deferred and count < WARM_BATCH:
+        key = keys.get(_deferred.pop())
+        if key is not None and key.is_property_set("in_betweens"):
+            subscribe_key(key)
+            inbetween_index(key.in_betweens)
+            driver_index(key)
+            count += 1
+    return WARM_INTERVAL if _deferred else None
 
 
 @bpy.app.handlers.persistent
+@instrumented
 def enable_message_broker(_=None) -> None:
-    bpy.msgbus.clear_by_owner(MESSAGE_BROKER)
-    bpy.msgbus.subscribe_rna(key=(bpy.types.ShapeKey, "name"),
-                             owner=MESSAGE_BROKER,
-                             args=tuple(),
-                             notify=shape_key_name_callback)
+    """Resets name subscriptions on file load. Keys are subscribed lazily by key_ensure() or
+    by a timer while idle, so loading a file only records which Keys need it.
+    """
+    for owner in _owners.values():
+        bpy.msgbus.clear_by_owner(owner)
+    _owners.clear()
+    _datamaps.clear()
+    rename_transactions_clear()
+
+    _deferred.clear()
+    _deferred.update(key.as_pointer() for key in bpy.data.shape_keys if key.is_property_set("in_betweens"))
+
+    # Message bus notifications are not sent in background mode so there is nothing to warm
+    if _deferred and not bpy.app.background and not bpy.app.timers.is_registered(warm_timer):
+        bpy.app.timers.register(warm_timer, first_interval=WARM_INTERVAL)
@@ -0,0 +1,87 @@
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import bpy
+from .rows import inbetween_rows
+from .utils import symmetrical_side, symmetrical_split_cached
+if TYPE_CHECKING:
+    from bpy.types import Key
+
+_candidates: Dict[int, 'Candidates'] = {}
+
+
+class Candidates:
+    """Shape keys of a Key that can become in-betweens: neither driven, a hero nor already
+    an in-between
+    """
+
+    __slots__ = ("names", "paths", "counts", "shapes", "_ranked")
+
+    def __init__(self, key: 'Key', names: Tuple[str, ...], paths: Tuple[str, ...]) -> None:
+        self.names = names
+        self.paths = paths
+        self.counts = Candidates.sizes(key)
+        self._ranked: Dict[str, List[str]] = {}
+
+        driven = set(paths)
+        excluded = set()
+        if key.is_property_set("in_betweens"):
+            inbetweens = key.in_betweens
+            excluded.update(inbetween_rows(inbetweens).names)
+            excluded.update(hero.name for hero in inbetweens.heros)
+
+        self.shapes = [name for name in names[1:]
+                       if name not in excluded and f'key_blocks["{name}"].value' not in driven]
+
+    @staticmethod
+    def sizes(key: 'Key') -> Tuple[int, int]:
+        if key.is_property_set("in_betweens"):
+            inbetweens = key.in_betweens
+            return len(inbetweens.collection__internal__), len(inbetweens.heros)
+        return 0, 0
+
+    def is_valid(self, key: 'Key', names: Tuple[str, ...], paths: Tuple[str, ...]) -> bool:
+        return self.names == names and self.paths == paths and self.counts == Candidates.sizes(key)
+
+    def ranked(self, hero: str) -> List[str]:
+        """Returns the candidates ordered by likeness to hero: same side first, then by the
+        length of the name prefix shared with hero, then by name.
+        """
+        result = self._ranked.get(hero)
+        if result is None:
+            side = symmetrical_side(hero)
+            base = symmetrical_split_cached(hero)[1].lower()
+
+            def score(name: str) -> Tuple[bool, int, str]:
+                other = symmetrical_split_cached(name)[1].lower()
+                size = 0
+                for a, b in zip(base, other):
+                    if a != b:
+                        break
+                    size += 1
+                return symmetrical_side(name) != side, -size, name
+
+            result = self._ranked[hero] = sorted((name for name in self.shapes if name != hero), key=score)
+        return result
+
+
+def candidates(key: 'Key', hero: Optional[str]="") -> List[str]:
+    """Returns the names of the shape keys on the Key that can become in-betweens of hero,
+    best matches first. Results are cached until the Key's blocks, drivers or in-betweens
+    change.
+    """
+    pointer = key.as_pointer()
+    names = tuple(key.key_blocks.keys())
+
+    # Current driver paths rather than the driver index, which can lag behind key block renames
+    animdata = key.animation_data
+    paths = tuple(fcurve.data_path for fcurve in animdata.drivers) if animdata is not None else ()
+
+    entry = _candidates.get(pointer)
+    if entry is None or not entry.is_valid(key, names, paths):
+        entry = _candidates[pointer] = Candidates(key, names, paths)
+    return entry.ranked(hero)
+
+
+@bpy.app.handlers.persistent
+def candidates_clear(_=None) -> None:
+    _candidates.clear()
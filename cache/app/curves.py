@@ -0,0 +1,89 @@
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .keyframes import Point
+
+BEZIER_CACHE_SIZE = 256
+
+
+class BezierCache:
+    """Least-recently-used cache of Bezier conversions of curves normalized to the unit square"""
+
+    def __init__(self, maxsize: int=BEZIER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Tuple[Point, ...]]' = OrderedDict()
+
+    def get(self, signature: Hashable, convert: Callable[[], Iterable['Point']]) -> Tuple['Point', ...]:
+        data = self._data
+        points = data.get(signature)
+        if points is not None:
+            data.move_to_end(signature)
+            self.hits += 1
+            return points
+
+        self.misses += 1
+        points = data[signature] = tuple((tuple(co), tuple(hl), tuple(hr)) for co, hl, hr in convert())
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+        return points
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            }
+
+
+bezier_cache = BezierCache()
+
+
+def curve_signature(points: Iterable) -> Tuple:
+    return tuple((tuple(point.location), point.handle_type) for point in points)
+
+
+def bezier_remap(points: Iterable['Point'],
+                 range_x: Tuple[float, float],
+                 range_y: Tuple[float, float]) -> List['Point']:
+    x0, x1 = range_x
+    y0, y1 = range_y
+    sx = x1 - x0
+    sy = y1 - y0
+    return [tuple((x0 + x * sx, y0 + y * sy) for x, y in point) for point in points]
+
+
+def to_bezier_cached(points: Iterable,
+                     convert: Callable[[Tuple[float, float], Tuple[float, float]], Iterable['Point']],
+                     range_x: Tuple[float, float],
+                     range_y: Tuple[float, float]) -> List['Point']:
+    """Converts curve points to Bezier (co, handle_left, handle_right) points within range_x
+    and range_y. convert(range_x, range_y) performs the actual conversion and is only called
+    (with the unit ranges) when the curve's shape is not already cached.
+    """
+    unit = (0.0, 1.0)
+    normalized = bezier_cache.get(curve_signature(points), lambda: convert(unit, unit))
+    return bezier_remap(normalized, range_x, range_y)
+
+
+def curve_points_data(points: Iterable) -> List[Tuple[float, float, str]]:
+    return [(point.location[0], point.location[1], point.handle_type) for point in points]
+
+
+def curve_points_assign(points, data: Sequence[Sequence]) -> None:
+    """Replaces a curve's points with data, a sequence of (x, y, handle_type) tuples"""
+    while len(points) > len(data):
+        points.remove(points[-1])
+    while len(points) < len(data):
+        points.new(0.0, 0.0)
+    for point, (x, y, handle_type) in zip(points, data):
+        point.location = (x, y)
+        point.handle_type = handle_type
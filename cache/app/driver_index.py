@@ -0,0 +1,71 @@
+
+from typing import Dict, Optional, TYPE_CHECKING
+import bpy
+if TYPE_CHECKING:
+    from bpy.types import AnimData, FCurve, Key
+
+PROXY_VARIABLE_PREFIX = "inbetween_"
+
+_indexes: Dict[int, 'DriverIndex'] = {}
+
+
+class DriverIndex:
+    """Maps driver data paths and in-between proxy variable names to driver F-Curves"""
+
+    __slots__ = ("count", "paths", "variables")
+
+    def __init__(self, animdata: Optional['AnimData']) -> None:
+        self.count = 0
+        self.paths: Dict[str, int] = {}
+        self.variables: Dict[str, int] = {}
+        if animdata is not None:
+            drivers = animdata.drivers
+            self.count = len(drivers)
+            for position, fcurve in enumerate(drivers):
+                self.paths.setdefault(fcurve.data_path, position)
+                for name in fcurve.driver.variables.keys():
+                    if name.startswith(PROXY_VARIABLE_PREFIX):
+                        self.variables.setdefault(name, position)
+
+    def is_valid(self, animdata: Optional['AnimData']) -> bool:
+        return self.count == (len(animdata.drivers) if animdata is not None else 0)
+
+
+def driver_index(key: 'Key', rebuild: Optional[bool]=False) -> DriverIndex:
+    pointer = key.as_pointer()
+    animdata = key.animation_data
+    index = None if rebuild else _indexes.get(pointer)
+    if index is None or not index.is_valid(animdata):
+        index = _indexes[pointer] = DriverIndex(animdata)
+    return index
+
+
+def driver_index_find(key: 'Key', data_path: str) -> Optional['FCurve']:
+    # Renaming a key block rewrites driver paths without changing the driver count, so a
+    # miss or mismatch rebuilds the index once before giving up
+    for rebuild in (False, True):
+        position = driver_index(key, rebuild).paths.get(data_path)
+        if position is not None:
+            fcurve = key.animation_data.drivers[position]
+            if fcurve.data_path == data_path:
+                return fcurve
+
+
+def driver_index_find_variable(key: 'Key', name: str) -> Optional['FCurve']:
+    position = driver_index(key).variables.get(name)
+    if position is not None:
+        fcurve = key.animation_data.drivers[position]
+        if fcurve.driver.variables.get(name) is not None:
+            return fcurve
+        position = driver_index(key, rebuild=True).variables.get(name)
+        if position is not None:
+            return key.animation_data.drivers[position]
+
+
+def driver_index_invalidate(key: 'Key') -> None:
+    _indexes.pop(key.as_pointer(), None)
+
+
+@bpy.app.handlers.persistent
+def driver_index_clear(_=None) -> None:
+    _indexes.clear()
@@ -1,29 +1,77 @@
 
-from typing import TYPE_CHECKING
-from ..lib.driver_utils import driver_ensure, driver_variables_clear
+from typing import Sequence, Tuple, TYPE_CHECKING
+from ..lib.driver_utils import driver_ensure
+from .driver_index import PROXY_VARIABLE_PREFIX, driver_index_invalidate
 if TYPE_CHECKING:
-    from bpy.types import ShapeKey
+    from bpy.types import Driver, ID, ShapeKey
     from ..api.hero import InBetweenHero
     from ..api.in_between import InBetween
 
 HERO_VALUE_VARIABLE_NAME = "hero"
 
 
+def driver_variables_sync(driver: 'Driver',
+                          id: 'ID',
+                          targets: Sequence[Tuple[str, str]],
+                          expression: str,
+                          id_type: str='KEY') -> bool:
+    """Brings the driver's single property variables in line with targets, a sequence of
+    (name, data_path) pairs, touching only the variables that differ. The driver type and
+    expression are only assigned when they change. Returns True if anything was modified.
+    """
+    changed = False
+    variables = driver.variables
+    names = {name for name, _ in targets}
+
+    for name in [name for name in variables.keys() if name not in names]:
+        variables.remove(variables[name])
+        changed = True
+
+    for name, path in targets:
+        variable = variables.get(name)
+        if variable is None:
+            variable = variables.new()
+            variable.type = 'SINGLE_PROP'
+            variable.name = name
+            changed = True
+        elif variable.type != 'SINGLE_PROP':
+            variable.type = 'SINGLE_PROP'
+            changed = True
+
+        target = variable.targets[0]
+        if target.id_type != id_type:
+            target.id_type = id_type
+            changed = True
+        if target.id != id:
+            target.id = id
+            changed = True
+        if target.data_path != path:
+            target.data_path = path
+            changed = True
+
+    if driver.type != 'SCRIPTED':
+        driver.type = 'SCRIPTED'
+        changed = True
+
+    if driver.expression != expression:
+        driver.expression = expression
+        changed = True
+
+    return changed
+
+
 def value_data_path(shape_name: str) -> str:
     return f'key_blocks["{shape_name}"].value'
 
 
 def proxy_variable_name(inbetween: 'InBetween') -> str:
-    return f'inbetween_{inbetween.identifier}'
+    return f'{PROXY_VARIABLE_PREFIX}{inbetween.identifier}'
 
 
 def inbetween_value_driver_init(inbetween: 'InBetween', heroname: str) -> None:
     fcurve = driver_ensure(inbetween.id_data, value_data_path(inbetween.name))
     driver = fcurve.driver
 
-    variables = driver.variables
-    driver_variables_clear(variables)
-
     names = (proxy_variable_name(inbetween),
              "i", "w", HERO_VALUE_VARIABLE_NAME)
 
@@ -32,15 +80,5 @@ def inbetween_value_driver_init(inbetween: 'InBetween', heroname: str) -> None:
              inbetween.weight_property_path,
              value_data_path(heroname))
 
-    for name, path in zip(names, paths):
-        variable = variables.new()
-        variable.type = 'SINGLE_PROP'
-        variable.name = name
-
-        target = variable.targets[0]
-        target.id_type = 'KEY'
-        target.id = inbetween.id_data
-        target.data_path = path
-
-    driver.type = 'SCRIPTED'
-    driver.expression = "*".join(names[1:])
\ No newline at end of file
+    if driver_variables_sync(driver, inbetween.id_data, tuple(zip(names, paths)), "*".join(names[1:])):
+        driver_index_invalidate(inbetween.id_data)
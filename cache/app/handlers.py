@@ -2,26 +2,26 @@
 from typing import TYPE_CHECKING, Optional, Union
 from bpy.types import Key
 import bpy
+from .bus import key_from_pointer
+from .driver_index import PROXY_VARIABLE_PREFIX, driver_index_find_variable
+from .drivers import HERO_VALUE_VARIABLE_NAME
+from .rename import RenameTransaction, rename_suppressed
+from .stats import instrumented
+from .utils import inbetween_name_format
 if TYPE_CHECKING:
     from bpy.types import FCurve, ShapeKey
     from ..api.hero import InBetweenHero
     from ..api.in_between import InBetween
 
 _owners = {}
-_locks = {}
 
 
 def find_inbetween_value_driver(key: Key, inbetween_id: str) -> Optional['FCurve']:
-    animdata = key.animation_data
-    if animdata is not None:
-        varname = f'inbetweens_{inbetween_id}'
-        for fcurve in animdata.drivers:
-            if fcurve.driver.variables.get(varname) is not None:
-                return fcurve
+    return driver_index_find_variable(key, f'{PROXY_VARIABLE_PREFIX}{inbetween_id}')
 
 
 def get_hero_shape_key_name(fcurve: 'FCurve') -> Optional[str]:
-    variable = fcurve.driver.variables.get("hero_value")
+    variable = fcurve.driver.variables.get(HERO_VALUE_VARIABLE_NAME)
     if variable is not None and variable.type == 'SINGLE_PROP':
         target = variable.targets[0]
         if target.id_type == 'KEY':
@@ -34,61 +34,66 @@ def get_hero_shape_key_name(fcurve: 'FCurve') -> Optional[str]:
                         return name
 
 
-def on_in_between_name_update(id: str) -> None:
-    if _locks.get(id, False):
-        return
-    for key in bpy.data.shape_keys:
-        if key.is_property_set("in_betweens") :
-            inbetween = key.in_betweens.search(id)
-            if inbetween is not None:
-                fcurve = find_inbetween_value_driver(key, inbetween.identifier)
+@instrumented
+def on_in_between_name_update(pointer: int, id: str) -> None:
+    key = key_from_pointer(pointer)
+    if key is not None and key.is_property_set("in_betweens"):
+        inbetween = key.in_betweens.search(id)
+        if inbetween is not None:
+            fcurve = find_inbetween_value_driver(key, inbetween.identifier)
+            if fcurve is not None:
+                name = get_hero_shape_key_name(fcurve)
+                if name:
+                    try:
+                        shape = key.path_resolve(fcurve.data_path.rpartition(".")[0])
+                    except ValueError:
+                        pass
+                    else:
+                        if not rename_suppressed(pointer, id, shape.name):
+                            with RenameTransaction(key, name) as transaction:
+                                transaction.rename(inbetween, shape,
+                                                   inbetween_name_format(name, inbetween.activation.center))
+
+
+@instrumented
+def on_hero_name_update(pointer: int, id: str) -> None:
+    key = key_from_pointer(pointer)
+    if key is not None and key.is_property_set("in_betweens"):
+        hero = key.in_betweens.heros.search(id)
+        if hero is not None:
+            inbetweens = hero.in_betweens
+            if inbetweens:
+                fcurve = find_inbetween_value_driver(key, inbetweens[0].identifier)
                 if fcurve is not None:
                     name = get_hero_shape_key_name(fcurve)
                     if name:
-                        try:
-                            shape = key.path_resolve(fcurve.data_path)
-                        except ValueError:
-                            pass
-                        else:
-                            _locks[id] = True
-                            shape.name = format_inbetween_name(inbetween, name)
-                            del _locks[id]
-
-
-
-def on_hero_name_update(id: str) -> None:
-    for key in bpy.data.shape_keys:
-        if key.is_property_set("in_betweens"):
-            hero = key.in_betweens.heros.search(id)
-            if hero is not None:
-                inbetweens = hero.in_betweens
-                if inbetweens:
-                    fcurve = find_inbetween_value_driver(key, inbetweens[0].identifier)
-                    if fcurve is not None:
-                        name = get_hero_shape_key_name(fcurve)
-                        if name:
-                            shape = key.key_blocks.get(name)
-                            if shape is not None:
-                                for inbetween in inbetweens:
-                                    shape = key.key_blocks.get(inbetween.name)
-                                    if shape is not None:
-                                        _locks[inbetween.identifier] = True
-                                        shape.name = format_inbetween_name(inbetween, name)
-                                _locks.clear()
-            return
+                        hero["name"] = name
+                        kbs = key.key_blocks
+                        with RenameTransaction(key, name) as transaction:
+                            for inbetween in inbetweens:
+                                shape = kbs.get(inbetween.name)
+                                if shape is not None:
+                                    transaction.rename(inbetween, shape,
+                                                       inbetween_name_format(name, inbetween.activation.center))
 
 
 def subscribe_to_hero_name_updates(hero: 'InBetweenHero') -> None:
-    bpy.msgbus.subscribe(key=hero.id_data.key_blocks[hero.name].path_resolve("name", False),
-                         owner=_owners.setdefault(hero.identifier, object()),
-                         args=(hero.identifier,),
-                         notify=on_hero_name_update)
+    key = hero.id_data
+    bpy.msgbus.subscribe_rna(key=key.key_blocks[hero.name].path_resolve("name", False),
+                             owner=_owners.setdefault(hero.identifier, object()),
+                             args=(key.as_pointer(), hero.identifier),
+                             notify=on_hero_name_update)
 
 
 def subscribe_to_inbetween_name_updates(inbetween: 'InBetween') -> None:
-    bpy.msgbus.subscribe(key=inbetween.id_data.key_blocks[inbetween.name].path_resolve("name", False),
-                         owner=_owners.setdefault(inbetween.identifier, object()),
-                         args=(inbetween.identifier,),
-                         notify=on_in_between_name_update)
+    key = inbetween.id_data
+    bpy.msgbus.subscribe_rna(key=key.key_blocks[inbetween.name].path_resolve("name", False),
+                             owner=_owners.setdefault(inbetween.identifier, object()),
+                             args=(key.as_pointer(), inbetween.identifier),
+                             notify=on_in_between_name_update)
 
 def observers_init(component: Union['InBetween', 'InBetweenHero']) -> None:
+    if component.path_from_id().startswith("in_betweens.heros"):
+        subscribe_to_hero_name_updates(component)
+    else:
+        subscribe_to_inbetween_name_updates(component)
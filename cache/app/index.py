@@ -0,0 +1,87 @@
+
+from typing import Dict, List, Optional, TYPE_CHECKING
+import bpy
+if TYPE_CHECKING:
+    from ..api.in_between import InBetween
+    from ..api.in_betweens import InBetweens
+
+_indexes: Dict[int, 'InBetweenIndex'] = {}
+
+
+class InBetweenIndex:
+    """Maps hero identifiers to the in-betweens of that hero for a single Key"""
+
+    __slots__ = ("heros", "positions")
+
+    def __init__(self, inbetweens: 'InBetweens') -> None:
+        self.heros: Dict[str, List[str]] = {}
+        self.positions: Dict[str, int] = {}
+        for position, inbetween in enumerate(inbetweens.collection__internal__):
+            self.add(inbetween, position)
+
+    def add(self, inbetween: 'InBetween', position: int) -> None:
+        identifier = inbetween.identifier
+        self.positions[identifier] = position
+        self.heros.setdefault(inbetween.get("hero", ""), []).append(identifier)
+
+    def discard(self, identifier: str) -> None:
+        position = self.positions.pop(identifier, None)
+        if position is None:
+            return
+
+        for ids in self.heros.values():
+            if identifier in ids:
+                ids.remove(identifier)
+                break
+
+        positions = self.positions
+        for key, value in positions.items():
+            if value > position:
+                positions[key] = value - 1
+
+    def resolve(self, inbetweens: 'InBetweens', hero_id: str) -> Optional[List['InBetween']]:
+        data = inbetweens.collection__internal__
+        if len(data) != len(self.positions):
+            return None
+
+        result = []
+        positions = self.positions
+        for identifier in self.heros.get(hero_id, ()):
+            position = positions[identifier]
+            inbetween = data[position]
+            if inbetween.identifier != identifier or inbetween.get("hero", "") != hero_id:
+                return None
+            result.append(inbetween)
+        return result
+
+
+def inbetween_index(inbetweens: 'InBetweens', rebuild: Optional[bool]=False) -> InBetweenIndex:
+    pointer = inbetweens.id_data.as_pointer()
+    index = None if rebuild else _indexes.get(pointer)
+    if index is None:
+        index = _indexes[pointer] = InBetweenIndex(inbetweens)
+    return index
+
+
+def inbetween_index_lookup(inbetweens: 'InBetweens', hero_id: str) -> List['InBetween']:
+    result = inbetween_index(inbetweens).resolve(inbetweens, hero_id)
+    if result is None:
+        result = inbetween_index(inbetweens, rebuild=True).resolve(inbetweens, hero_id)
+    return result
+
+
+def inbetween_index_add(inbetweens: 'InBetweens', inbetween: 'InBetween') -> None:
+    index = _indexes.get(inbetweens.id_data.as_pointer())
+    if index is not None:
+        index.add(inbetween, len(inbetweens.collection__internal__) - 1)
+
+
+def inbetween_index_discard(inbetweens: 'InBetweens', identifier: str) -> None:
+    index = _indexes.get(inbetweens.id_data.as_pointer())
+    if index is not None:
+        index.discard(identifier)
+
+
+@bpy.app.handlers.persistent
+def inbetween_index_clear(_=None) -> None:
+    _indexes.clear()
@@ -0,0 +1,194 @@
+
+from typing import Any, Dict, Iterable, List, Optional, Set, TYPE_CHECKING
+import bpy
+from .bus import owners_release, owners_stale, subscribe_key, subscriptions_stale, sync_key_names
+from .driver_index import PROXY_VARIABLE_PREFIX, driver_index, driver_index_invalidate
+from .drivers import inbetween_value_driver_init, value_data_path
+from .index import inbetween_index
+from .rows import inbetween_rows_invalidate
+if TYPE_CHECKING:
+    from bpy.types import Key
+
+INBETWEEN_MISSING_SHAPE = 'INBETWEEN_MISSING_SHAPE'
+INBETWEEN_ORPHANED = 'INBETWEEN_ORPHANED'
+INBETWEEN_MISSING_DRIVER = 'INBETWEEN_MISSING_DRIVER'
+HERO_MISSING_SHAPE = 'HERO_MISSING_SHAPE'
+HERO_EMPTY = 'HERO_EMPTY'
+DRIVER_ORPHANED = 'DRIVER_ORPHANED'
+SUBSCRIPTIONS_STALE = 'SUBSCRIPTIONS_STALE'
+OWNER_STALE = 'OWNER_STALE'
+
+
+class Issue:
+
+    __slots__ = ("key", "type", "name", "identifier", "message", "repaired")
+
+    def __init__(self, key: str, type: str, name: str, identifier: str, message: str) -> None:
+        self.key = key
+        self.type = type
+        self.name = name
+        self.identifier = identifier
+        self.message = message
+        self.repaired = False
+
+    def __repr__(self) -> str:
+        return f'<Issue {self.type} {self.key}:{self.name} ({self.message})>'
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "type": self.type,
+            "name": self.name,
+            "identifier": self.identifier,
+            "message": self.message,
+            "repaired": self.repaired,
+            }
+
+
+def check_key(key: 'Key', repair: Optional[bool]=False) -> List[Issue]:
+    """Returns the problems found with the in-betweens of the Key, repairing them if repair
+    is True. In-between and hero records without a shape key are removed, as are in-betweens
+    without a hero, heros without in-betweens and drivers whose proxy variable refers to no
+    in-between. Missing drivers are recreated and stale name subscriptions are renewed.
+    """
+    issues: List[Issue] = []
+    if not key.is_property_set("in_betweens"):
+        return issues
+
+    # Stored names may predate renames made without notifications (e.g. in background mode)
+    # so they are refreshed first, and only shapes still missing afterwards are reported
+    sync_key_names(key)
+    inbetween_rows_invalidate(key)
+
+    keyname = key.name
+    shapes = set(key.key_blocks.keys())
+    inbetweens = key.in_betweens
+    data = inbetweens.collection__internal__
+    heros = inbetweens.heros.collection__internal__
+    # Rebuilt since key block renames leave old paths in a cached index
+    drivers = driver_index(key, rebuild=True)
+
+    hero_names: Dict[str, str] = {}
+    for hero in heros:
+        if hero.name in shapes:
+            hero_names[hero.identifier] = hero.name
+        else:
+            issues.append(Issue(keyname, HERO_MISSING_SHAPE, hero.name, hero.identifier,
+                                "Hero shape key does not exist"))
+
+    used: Set[str] = set()
+    identifiers: Set[str] = set()
+    remove: List[int] = []
+    rebuild: List[int] = []
+
+    for position, inbetween in enumerate(data):
+        identifier = inbetween.identifier
+        identifiers.add(identifier)
+        hero_id = inbetween.get("hero", "")
+        if inbetween.name not in shapes:
+            issues.append(Issue(keyname, INBETWEEN_MISSING_SHAPE, inbetween.name, identifier,
+                                "In-between shape key does not exist"))
+            remove.append(position)
+        elif hero_id not in hero_names:
+            issues.append(Issue(keyname, INBETWEEN_ORPHANED, inbetween.name, identifier,
+                                "In-between has no hero"))
+            remove.append(position)
+        else:
+            used.add(hero_id)
+            if value_data_path(inbetween.name) not in drivers.paths:
+                issues.append(Issue(keyname, INBETWEEN_MISSING_DRIVER, inbetween.name, identifier,
+                                    "In-between shape key is not driven"))
+                rebuild.append(position)
+
+    empty = [hero for hero in heros if hero.identifier in hero_names and hero.identifier not in used]
+    for hero in empty:
+        issues.append(Issue(keyname, HERO_EMPTY, hero.name, hero.identifier, "Hero has no in-betweens"))
+
+    orphaned = []
+    for name, position in drivers.variables.items():
+        identifier = name[len(PROXY_VARIABLE_PREFIX):]
+        if identifier not in identifiers:
+            fcurve = key.animation_data.drivers[position]
+            issues.append(Issue(keyname, DRIVER_ORPHANED, fcurve.data_path, identifier,
+                                f'Driver variable {name} refers to no in-between'))
+            orphaned.append(fcurve.data_path)
+
+    if subscriptions_stale(key, identifiers.union(hero.identifier for hero in heros)):
+        issues.append(Issue(keyname, SUBSCRIPTIONS_STALE, keyname, "",
+                            "Name subscriptions refer to removed in-betweens or heros"))
+
+    if repair and issues:
+        animdata = key.animation_data
+
+        # Drivers are resolved by path since removing F-Curves invalidates the index
+        if animdata is not None:
+            for path in orphaned:
+                fcurve = animdata.drivers.find(path)
+                if fcurve is not None:
+                    animdata.drivers.remove(fcurve)
+
+        for position in rebuild:
+            inbetween = data[position]
+            inbetween_value_driver_init(inbetween, hero_names[inbetween["hero"]])
+            inbetween.update()
+
+        for position in reversed(remove):
+            path = value_data_path(data[position].name)
+            fcurve = animdata.drivers.find(path) if animdata is not None else None
+            if fcurve is not None:
+                animdata.drivers.remove(fcurve)
+            data.remove(position)
+
+        removed = {hero.identifier for hero in empty}.union(
+            hero.identifier for hero in heros if hero.identifier not in hero_names)
+        for position in reversed(range(len(heros))):
+            if heros[position].identifier in removed:
+                heros.remove(position)
+
+        driver_index_invalidate(key)
+        inbetween_index(inbetweens, rebuild=True)
+        inbetween_rows_invalidate(key)
+        subscribe_key(key)
+
+        for issue in issues:
+            issue.repaired = True
+
+    return issues
+
+
+def check_all(repair: Optional[bool]=False) -> List[Issue]:
+    """Checks every Key in bpy.data.shape_keys and the name subscription owners of Keys that
+    no longer exist
+    """
+    issues = []
+    pointers = set()
+    for key in bpy.data.shape_keys:
+        pointers.add(key.as_pointer())
+        issues.extend(check_key(key, repair))
+
+    stale = owners_stale(pointers)
+    if stale:
+        issue = Issue("", OWNER_STALE, "", "", f'{len(stale)} subscription owners refer to removed Keys')
+        if repair:
+            owners_release(stale)
+            issue.repaired = True
+        issues.append(issue)
+
+    return issues
+
+
+def check_files(filepaths: Iterable[str], repair: Optional[bool]=False) -> Dict[str, List[Dict[str, Any]]]:
+    """Opens each .blend file and checks every Key in it, saving the file if repairs were
+    made. Returns the issues found keyed by file path. Intended for headless use, e.g.
+
+        blender -b --python-expr "import glob; from <addon>.app.integrity import check_files; \\
+            print(check_files(glob.glob('/library/**/*.blend', recursive=True)))"
+    """
+    result = {}
+    for filepath in filepaths:
+        bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False)
+        issues = check_all(repair)
+        if repair and any(issue.repaired for issue in issues):
+            bpy.ops.wm.save_mainfile(filepath=filepath)
+        result[filepath] = [issue.as_dict() for issue in issues]
+    return result
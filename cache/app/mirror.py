@@ -0,0 +1,41 @@
+
+from typing import Optional, TYPE_CHECKING
+import numpy as np
+from .shapes import shape_key_coordinates
+if TYPE_CHECKING:
+    from bpy.types import ShapeKey
+
+MIRROR_TOLERANCE = 1e-4
+MIRROR_AXIS = np.array((-1.0, 1.0, 1.0), dtype=np.float32)
+
+
+def mirror_map(co: np.ndarray, tolerance: Optional[float]=MIRROR_TOLERANCE) -> np.ndarray:
+    """Returns the index of the vertex mirrored across the X axis for each of the (N, 3)
+    coordinates in co, or -1 where there is none within tolerance.
+    """
+    count = len(co)
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+
+    grid = np.round(co / tolerance).astype(np.int64)
+    rows = np.concatenate((grid, grid * np.array((-1, 1, 1), dtype=np.int64)))
+    _, inverse = np.unique(rows, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+
+    lookup = np.full(inverse.max() + 1, -1, dtype=np.int64)
+    lookup[inverse[:count]] = np.arange(count)
+    return lookup[inverse[count:]]
+
+
+def shape_key_mirror(source: 'ShapeKey',
+                     target: 'ShapeKey',
+                     basis: np.ndarray,
+                     mirror: np.ndarray) -> None:
+    """Writes source's deltas from basis, mirrored across the X axis, to target. Vertices
+    without a mirror are reset to basis.
+    """
+    delta = shape_key_coordinates(source) - basis
+    valid = mirror >= 0
+    co = basis.copy()
+    co[mirror[valid]] += delta[valid] * MIRROR_AXIS
+    target.data.foreach_set("co", co.ravel())
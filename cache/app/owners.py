@@ -0,0 +1,53 @@
+
+from typing import Dict, Optional, TYPE_CHECKING
+import bpy
+from ..ops.base import COMPAT_OBJECTS
+if TYPE_CHECKING:
+    from bpy.types import Key, Object
+
+_owners: Dict[int, str] = {}
+_object_count = -1
+
+
+def key_owners_rebuild() -> None:
+    """Maps every Key to the name of the first object (alphabetically) that uses it"""
+    global _object_count
+    _owners.clear()
+    objects = bpy.data.objects
+    _object_count = len(objects)
+    for object in objects:
+        if object.type in COMPAT_OBJECTS:
+            data = object.data
+            key = getattr(data, "shape_keys", None)
+            if key is not None:
+                _owners.setdefault(key.as_pointer(), object.name)
+
+
+def key_owner(key: 'Key') -> Optional['Object']:
+    pointer = key.as_pointer()
+    if _object_count == len(bpy.data.objects) and pointer in _owners:
+        object = bpy.data.objects.get(_owners[pointer])
+        if object is not None and object.data == key.user:
+            return object
+
+    key_owners_rebuild()
+    name = _owners.get(pointer)
+    if name is not None:
+        return bpy.data.objects.get(name)
+
+
+def key_owners_clear() -> None:
+    global _object_count
+    _owners.clear()
+    _object_count = -1
+
+
+@bpy.app.handlers.persistent
+def key_owners_load_handler(_=None) -> None:
+    key_owners_clear()
+
+
+@bpy.app.handlers.persistent
+def key_owners_depsgraph_handler(_=None, __=None) -> None:
+    if _object_count != len(bpy.data.objects):
+        key_owners_clear()
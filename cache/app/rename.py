@@ -0,0 +1,73 @@
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from .driver_index import driver_index_invalidate
+if TYPE_CHECKING:
+    from bpy.types import Key, ShapeKey
+    from ..api.in_between import InBetween
+
+_expected: Dict[Tuple[int, str], str] = {}
+
+
+class RenameTransaction:
+    """Renames in-between shape keys as a batch.
+
+    Name change notifications caused by the transaction's own renames are suppressed (see
+    rename_suppressed) and a single INBETWEENS::INBETWEENS_RENAMED event listing the
+    (old, new) names and the names left unchanged because their new name was taken (see
+    conflict) is sent when the transaction completes.
+    """
+
+    def __init__(self, key: 'Key', hero: Optional[str]="") -> None:
+        self.key = key
+        self.hero = hero
+        self.renamed: List[Tuple[str, str]] = []
+        self.conflicts: List[Tuple[str, str]] = []
+        self._log: List[Tuple['InBetween', 'ShapeKey', str]] = []
+
+    def __enter__(self) -> 'RenameTransaction':
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        if type is not None:
+            self.rollback()
+        elif self.renamed or self.conflicts:
+            self.key.asks.notify('INBETWEENS::INBETWEENS_RENAMED', self.hero,
+                                 names=tuple(self.renamed),
+                                 conflicts=tuple(self.conflicts))
+
+    def rename(self, inbetween: 'InBetween', shape: 'ShapeKey', name: str) -> None:
+        prev = shape.name
+        if prev != name:
+            self._log.append((inbetween, shape, prev))
+            shape.name = name
+            driver_index_invalidate(self.key)
+            inbetween["name"] = shape.name
+            _expected[(self.key.as_pointer(), inbetween.identifier)] = shape.name
+            self.renamed.append((prev, shape.name))
+
+    def conflict(self, name: str, final: str) -> None:
+        """Records that the shape key name could not become final because it is taken"""
+        self.conflicts.append((name, final))
+
+    def rollback(self) -> None:
+        """Restores the names the shape keys had before the transaction"""
+        # Undone in reverse so each name is free again when it is restored
+        for inbetween, shape, name in reversed(self._log):
+            shape.name = name
+            inbetween["name"] = shape.name
+            _expected[(self.key.as_pointer(), inbetween.identifier)] = shape.name
+        if self._log:
+            driver_index_invalidate(self.key)
+        self._log.clear()
+        self.renamed.clear()
+
+
+def rename_suppressed(pointer: int, identifier: str, name: str) -> bool:
+    """Returns True if name is the result of a transaction's rename of the in-between, in which
+    case the notification should be ignored.
+    """
+    return _expected.pop((pointer, identifier), None) == name
+
+
+def rename_transactions_clear() -> None:
+    _expected.clear()
@@ -0,0 +1,91 @@
+
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence, Tuple, TYPE_CHECKING
+import bpy
+if TYPE_CHECKING:
+    from bpy.types import Object
+
+
+def increasing_prefix(positions: Sequence[int]) -> int:
+    size = 0
+    last = None
+    for position in positions:
+        if last is not None and position < last:
+            break
+        last = position
+        size += 1
+    return size
+
+
+def shape_key_reorder_plan(names: Sequence[str], order: Sequence[str], top: int) -> List[Tuple[str, str]]:
+    """Returns the (type, name) moves that rearrange names into order.
+
+    Blocks in the longest prefix of order that already appear in ascending order stay put
+    and the rest are sent to the bottom, or blocks in the longest ascending suffix stay put
+    and the rest are sent to the top in reverse. Whichever needs fewer moves is returned.
+    """
+    lookup = {name: index for index, name in enumerate(names)}
+    positions = [lookup[name] for name in order]
+    count = len(positions)
+
+    head = increasing_prefix(positions)
+    if head == count:
+        return []
+
+    bottom = [('BOTTOM', name) for name in order[head:]]
+
+    if any(order[i] != names[i] for i in range(top)):
+        return bottom
+
+    tail = increasing_prefix([-x for x in reversed(positions[top:])])
+    if count - top - tail < len(bottom):
+        return [('TOP', name) for name in reversed(order[top:count - tail])]
+
+    return bottom
+
+
+@contextmanager
+def object_override(object: 'Object') -> Iterator[tuple]:
+    """Makes object the context object for operators called within the block. Yields the
+    positional arguments to pass to the operator (an override dictionary before Blender 3.2).
+    """
+    context = bpy.context
+    if hasattr(context, "temp_override"):
+        with context.temp_override(object=object, active_object=object):
+            yield ()
+    else:
+        override = context.copy()
+        override["object"] = object
+        override["active_object"] = object
+        yield (override,)
+
+
+def shape_key_reorder(object: 'Object', order: Sequence[str]) -> int:
+    """Rearranges the object's shape keys into order with as few move operations as possible.
+
+    order must contain every key block name. Returns the number of moves made.
+    """
+    shapes = object.data.shape_keys.key_blocks
+    names = shapes.keys()
+
+    if len(order) != len(names) or set(order) != set(names):
+        raise ValueError((f'shape_key_reorder(object, order): '
+                          f'Expected order to contain every shape key of {object.name}'))
+
+    top = 1 if object.data.shape_keys.use_relative else 0
+    plan = shape_key_reorder_plan(names, order, top)
+
+    if plan:
+        active = object.active_shape_key
+        with object_override(object) as override:
+            for type, name in plan:
+                object.active_shape_key_index = shapes.find(name)
+                bpy.ops.object.shape_key_move(*override, type=type)
+        if active is not None:
+            object.active_shape_key_index = shapes.find(active.name)
+
+        if shapes.keys() != list(order):
+            raise RuntimeError((f'shape_key_reorder(object, order): '
+                                f'Failed to reorder the shape keys of {object.name}'))
+
+    return len(plan)
@@ -0,0 +1,73 @@
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import bpy
+if TYPE_CHECKING:
+    from bpy.types import Key
+    from ..api.in_between import InBetween
+    from ..api.in_betweens import InBetweens
+
+_rows: Dict[int, 'InBetweenRows'] = {}
+
+
+class InBetweenRows:
+    """Row data for drawing the in-betweens of a single Key in a list"""
+
+    __slots__ = ("count", "heros", "centers", "names", "_filters")
+
+    def __init__(self, inbetweens: 'InBetweens') -> None:
+        data = inbetweens.collection__internal__
+        self.count = len(data)
+        self.heros: List[str] = []
+        self.centers: List[float] = []
+        self.names: Dict[str, int] = {}
+        self._filters: Dict[str, Tuple[List[int], List[int]]] = {}
+
+        for position, inbetween in enumerate(data):
+            self.heros.append(inbetween.get("hero", ""))
+            self.centers.append(inbetween.activation.center)
+            self.names[inbetween.name] = position
+
+    def filter(self, hero_id: str, flag: int) -> Tuple[List[int], List[int]]:
+        """Returns the (flags, order) UIList.filter_items() result for the hero's in-betweens
+        sorted by center
+        """
+        result = self._filters.get(hero_id)
+        if result is None:
+            heros = self.heros
+            flags = [flag if item == hero_id else 0 for item in heros]
+            order = [0] * self.count
+            ranked = sorted(range(self.count), key=lambda i: (heros[i] != hero_id, self.centers[i], i))
+            for rank, position in enumerate(ranked):
+                order[position] = rank
+            result = self._filters[hero_id] = (flags, order)
+        return result
+
+
+def inbetween_rows(inbetweens: 'InBetweens') -> InBetweenRows:
+    pointer = inbetweens.id_data.as_pointer()
+    rows = _rows.get(pointer)
+    if rows is None or rows.count != len(inbetweens.collection__internal__):
+        rows = _rows[pointer] = InBetweenRows(inbetweens)
+    return rows
+
+
+def inbetween_rows_find(inbetweens: 'InBetweens', name: str) -> Optional['InBetween']:
+    data = inbetweens.collection__internal__
+    position = inbetween_rows(inbetweens).names.get(name)
+    if position is not None and data[position].name == name:
+        return data[position]
+
+    # Cached names are stale after a rename so fall back to searching the collection
+    position = data.find(name)
+    if position >= 0:
+        inbetween_rows_invalidate(inbetweens.id_data)
+        return data[position]
+
+
+def inbetween_rows_invalidate(key: 'Key') -> None:
+    _rows.pop(key.as_pointer(), None)
+
+
+@bpy.app.handlers.persistent
+def inbetween_rows_clear(_=None) -> None:
+    _rows.clear()
@@ -0,0 +1,129 @@
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator, Optional, Set, Tuple, TYPE_CHECKING
+import bpy
+from .bus import key_ensure
+from .stats import instrumented
+if TYPE_CHECKING:
+    from ..api.in_between import InBetween
+
+# Edits of the same in-between closer together than this (e.g. a slider drag) are coalesced
+DRAG_INTERVAL = 0.1
+
+# Set on an in-between while its F-Curve lags behind its settings. It is stored with the
+# in-between so that undo steps pushed mid-drag record it and are repaired when restored.
+STALE_PROPERTY = "update_pending"
+
+_depth = 0
+_pending: Dict[int, Set[str]] = {}
+_edited: Dict[Tuple[int, str], float] = {}
+
+
+@contextmanager
+def deferred_updates() -> Iterator[None]:
+    """Collects the updates scheduled within the block and runs them together when the
+    outermost block exits, so an in-between edited many times is only updated once.
+    """
+    global _depth
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        if _depth == 0:
+            flush()
+
+
+def schedule_update(inbetween: 'InBetween') -> None:
+    """Updates the in-between now, when the enclosing deferred_updates() block exits or,
+    while it is being edited interactively (e.g. a slider drag), at most once per
+    DRAG_INTERVAL. Updates left pending by a drag mark the in-between stale so that an undo
+    step pushed before they run is repaired by scheduler_stale_handler when restored.
+    """
+    pointer = inbetween.id_data.as_pointer()
+    identifier = inbetween.identifier
+
+    if _depth > 0:
+        _pending.setdefault(pointer, set()).add(identifier)
+        return
+
+    # Timers do not run in background mode so scripts always update synchronously
+    if not bpy.app.background:
+        now = perf_counter()
+        last = _edited.get((pointer, identifier))
+        _edited[(pointer, identifier)] = now
+        if last is not None and now - last < DRAG_INTERVAL:
+            _pending.setdefault(pointer, set()).add(identifier)
+            inbetween[STALE_PROPERTY] = True
+            if not bpy.app.timers.is_registered(flush_timer):
+                bpy.app.timers.register(flush_timer, first_interval=DRAG_INTERVAL)
+            return
+
+    inbetween.update()
+
+
+@instrumented
+def flush() -> int:
+    """Updates all pending in-betweens now. Returns the number of in-betweens updated."""
+    if not _pending:
+        return 0
+
+    pending = dict(_pending)
+    _pending.clear()
+
+    # Keys are resolved by pointer so a Key renamed in the meantime keeps its pending work
+    keys = {key.as_pointer(): key for key in bpy.data.shape_keys}
+
+    count = 0
+    for pointer, identifiers in pending.items():
+        key = keys.get(pointer)
+        if key is not None and key.is_property_set("in_betweens"):
+            key_ensure(key)
+            inbetweens = key.in_betweens
+            for identifier in identifiers:
+                inbetween = inbetweens.search(identifier)
+                if inbetween is not None:
+                    inbetween_refresh(inbetween)
+                    count += 1
+    return count
+
+
+def inbetween_refresh(inbetween: 'InBetween') -> None:
+    if STALE_PROPERTY in inbetween:
+        del inbetween[STALE_PROPERTY]
+    inbetween.update()
+
+
+def flush_timer() -> Optional[float]:
+    """Runs the updates coalesced during a drag, waiting while edits are still arriving"""
+    flush()
+    if _edited and perf_counter() - max(_edited.values()) < DRAG_INTERVAL:
+        return DRAG_INTERVAL
+    _edited.clear()
+    return None
+
+
+@bpy.app.handlers.persistent
+def scheduler_flush_handler(_=None) -> None:
+    flush()
+
+
+@bpy.app.handlers.persistent
+def scheduler_stale_handler(_=None) -> None:
+    """Updates in-betweens restored (by undo, redo or loading a file) with a stale F-Curve"""
+    _pending.clear()
+    for key in bpy.data.shape_keys:
+        if key.is_property_set("in_betweens"):
+            for inbetween in key.in_betweens.collection__internal__:
+                if STALE_PROPERTY in inbetween:
+                    key_ensure(key)
+                    inbetween_refresh(inbetween)
+
+
+@bpy.app.handlers.persistent
+def scheduler_clear_handler(_=None) -> None:
+    global _depth
+    _pending.clear()
+    _edited.clear()
+    _depth = 0
@@ -0,0 +1,55 @@
+
+from typing import Callable, List, Tuple
+import bpy
+from .bus import enable_message_broker
+from .candidates import candidates_clear
+from .driver_index import driver_index_clear
+from .index import inbetween_index_clear
+from .owners import key_owners_depsgraph_handler, key_owners_load_handler
+from .rows import inbetween_rows_clear
+from .scheduler import scheduler_clear_handler, scheduler_flush_handler, scheduler_stale_handler
+
+# (bpy.app.handlers list name, handler) pairs installed by register()
+HANDLERS: List[Tuple[str, Callable]] = [
+    ("load_post", candidates_clear),
+    ("load_post", driver_index_clear),
+    ("load_post", inbetween_index_clear),
+    ("load_post", key_owners_load_handler),
+    ("load_post", inbetween_rows_clear),
+    ("load_post", scheduler_clear_handler),
+    ("load_post", enable_message_broker),
+    ("load_post", scheduler_stale_handler),
+    ("undo_pre", scheduler_flush_handler),
+    ("redo_pre", scheduler_flush_handler),
+    ("save_pre", scheduler_flush_handler),
+    ("undo_post", candidates_clear),
+    ("redo_post", candidates_clear),
+    ("undo_post", inbetween_index_clear),
+    ("redo_post", inbetween_index_clear),
+    ("undo_post", inbetween_rows_clear),
+    ("redo_post", inbetween_rows_clear),
+    # After the caches above are cleared since it looks in-betweens up through them
+    ("undo_post", scheduler_stale_handler),
+    ("redo_post", scheduler_stale_handler),
+    ("depsgraph_update_post", key_owners_depsgraph_handler),
+    ]
+
+
+def register() -> None:
+    for name, handler in HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler not in handlers:
+            handlers.append(handler)
+
+    # Enabling the add-on on an open file sends no load_post, so its Keys are recorded for
+    # subscription now. bpy.data is restricted while add-ons load at startup, when the
+    # startup file's load_post follows anyway.
+    if isinstance(bpy.data, bpy.types.BlendData):
+        enable_message_broker()
+
+
+def unregister() -> None:
+    for name, handler in reversed(HANDLERS):
+        handlers = getattr(bpy.app.handlers, name)
+        if handler in handlers:
+            handlers.remove(handler)
@@ -0,0 +1,32 @@
+
+from typing import Optional, TYPE_CHECKING
+import numpy as np
+if TYPE_CHECKING:
+    from bpy.types import ShapeKey
+
+
+def shape_key_coordinates(shape: 'ShapeKey', out: Optional[np.ndarray]=None) -> np.ndarray:
+    """Returns the (N, 3) coordinates of shape, reading into out if given"""
+    data = shape.data
+    if out is None:
+        out = np.empty((len(data), 3), dtype=np.float32)
+    data.foreach_get("co", out.ravel())
+    return out
+
+
+def shape_key_seed(shape: 'ShapeKey', hero: 'ShapeKey', factor: float) -> bool:
+    """Sets shape to its relative key plus the hero's delta (from the hero's relative key)
+    scaled by factor. Returns False if the shape's points have no single co attribute (e.g.
+    curves), in which case shape is left unchanged.
+    """
+    data = shape.data
+    if len(data) == 0 or data[0].rna_type.identifier != 'ShapeKeyPoint':
+        return False
+
+    co = shape_key_coordinates(hero)
+    co -= shape_key_coordinates(hero.relative_key)
+    co *= factor
+    co += shape_key_coordinates(shape.relative_key)
+    data.foreach_set("co", co.ravel())
+    shape.id_data.user.update_tag()
+    return True
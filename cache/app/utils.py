@@ -1,7 +1,38 @@
 
+import re
+from functools import lru_cache
+from typing import Tuple
 from ..lib.symmetry import symmetrical_split
 
+SIDE_PATTERN = re.compile(r'LEFT|RIGHT|Left|Right|left|right|L|R|l|r')
+SIDE_FLIPS = {
+    "LEFT": "RIGHT", "RIGHT": "LEFT",
+    "Left": "Right", "Right": "Left",
+    "left": "right", "right": "left",
+    "L": "R", "R": "L",
+    "l": "r", "r": "l",
+    }
+
+
+@lru_cache(maxsize=4096)
+def symmetrical_split_cached(name: str) -> Tuple[str, str, str]:
+    return symmetrical_split(name)
+
+
+def symmetrical_flip(name: str) -> str:
+    """Returns the name of the opposite side (e.g. Smile.L -> Smile.R), or name if it has no side"""
+    pfix, base, sfix = symmetrical_split_cached(name)
+    flip = lambda match: SIDE_FLIPS[match.group(0)]
+    return f'{SIDE_PATTERN.sub(flip, pfix)}{base}{SIDE_PATTERN.sub(flip, sfix)}'
+
+
+def symmetrical_side(name: str) -> str:
+    """Returns 'L' or 'R' for the side of name, or an empty string if it has no side"""
+    pfix, _, sfix = symmetrical_split_cached(name)
+    match = SIDE_PATTERN.search(pfix) or SIDE_PATTERN.search(sfix)
+    return match.group(0)[0].upper() if match else ""
+
 
 def inbetween_name_format(heroname: str, center: float) -> str:
-    pfix, base, sfix = symmetrical_split(heroname)
-    return f'{pfix}{base}_{center:.3f}{sfix}'
\ No newline at end of file
+    pfix, base, sfix = symmetrical_split_cached(heroname)
+    return f'{pfix}{base}_{center:.3f}{sfix}'
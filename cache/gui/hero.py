@@ -1,37 +1,76 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
-from bpy.types import Panel
+from bpy.types import Panel, UIList, UI_UL_list
 from ..lib.asks import split_layout
+from ..app.bus import key_ensure
+from ..app.rows import inbetween_rows
 if TYPE_CHECKING:
     from bpy.types import Context, UILayout
     from ..api.hero import InBetweenHero
+    from ..api.in_between import InBetween
+    from ..api.in_betweens import InBetweens
 
+PAGE_ROWS = 8
 
-def draw_hero_settings(layout: 'UILayout',
-                       hero: 'InBetweenHero',
-                       label: Optional[str]="In-Betweens",
-                       **split_options: Dict[str, Any]) -> None:
 
-    column = split_layout(layout, label, **split_options)
-    column.operator("in_betweens.inbetween_add", text="Add", icon='ADD')
+class INBETWEENS_UL_inbetweens(UIList):
+    """Lists the in-betweens of the hero whose identifier is the list_id, sorted by center.
+    Only visible rows are drawn and the filter result is cached until in-betweens change.
+    """
 
-    for inbetween in hero.in_betweens:
-        row = column.row()
+    def draw_item(self,
+                  context: 'Context',
+                  layout: 'UILayout',
+                  data: 'InBetweens',
+                  item: 'InBetween',
+                  icon: int,
+                  active_data: 'InBetweenHero',
+                  active_propname: str,
+                  index: int) -> None:
 
-        row.prop(inbetween.activation, "center", text="")
+        row = layout.row()
+        row.prop(item.activation, "center", text=item.name, emboss=False)
 
         row.operator("in_betweens.settings_popup",
                      text="",
                      icon='SETTINGS',
-                     emboss=False).identifier = inbetween.identifier
-
-        row.separator()
+                     emboss=False).identifier = item.identifier
 
         row.operator("in_betweens.inbetween_remove",
                      text="",
                      icon='X',
-                     emboss=False).identifier = inbetween.identifier
-    
+                     emboss=False).identifier = item.identifier
+
+    def filter_items(self, context: 'Context', data: 'InBetweens', propname: str):
+        flags, order = inbetween_rows(data).filter(self.list_id, self.bitflag_filter_item)
+
+        if self.filter_name:
+            items = getattr(data, propname)
+            names = UI_UL_list.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items)
+            flags = [a & b for a, b in zip(flags, names)]
+
+        if self.use_filter_sort_alpha:
+            order = UI_UL_list.sort_items_by_name(getattr(data, propname))
+
+        return flags, order
+
+
+def draw_hero_settings(layout: 'UILayout',
+                       hero: 'InBetweenHero',
+                       label: Optional[str]="In-Betweens",
+                       **split_options: Dict[str, Any]) -> None:
+
+    column = split_layout(layout, label, **split_options)
+    column.operator("in_betweens.inbetween_add", text="Add", icon='ADD')
+    column.template_list(INBETWEENS_UL_inbetweens.__name__,
+                         hero.identifier,
+                         hero.id_data.in_betweens,
+                         "collection__internal__",
+                         hero,
+                         "active_index",
+                         rows=3,
+                         maxrows=PAGE_ROWS)
+
 
 class INBETWEENS_PT_hero_settings(Panel):
 
@@ -56,4 +95,5 @@ class INBETWEENS_PT_hero_settings(Panel):
     def draw(self, context: 'Context') -> None:
         shape = context.object.active_shape_key
         key = shape.id_data
+        key_ensure(key)
         draw_hero_settings(self.layout, key.in_betweens.heros[shape])
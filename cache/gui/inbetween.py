@@ -4,6 +4,8 @@ from bpy.types import Panel
 from in_betweens.gui.utils import layout_split
 from in_betweens.lib.curve_mapping import draw_curve_manager_ui
 from ..lib.asks import split_layout
+from ..app.bus import key_ensure
+from ..app.rows import inbetween_rows_find
 from ..ops.activation_value import INBETWEEN_OT_activation_value_actions
 if TYPE_CHECKING:
     from bpy.types import Context, UILayout
@@ -48,9 +50,12 @@ class INBETWEENS_PT_inbetween(Panel):
             shape = object.active_shape_key
             if shape is not None:
                 key = shape.id_data
-                return key.is_property_set("in_betweens") and shape in key.in_betweens
+                return (key.is_property_set("in_betweens")
+                        and inbetween_rows_find(key.in_betweens, shape.name) is not None)
         return False
 
     def draw(self, context: 'Context') -> None:
         shape = context.object.active_shape_key
-        draw_inbetween_settings(self.layout, shape.id_data.in_betweens[shape])
+        key = shape.id_data
+        key_ensure(key)
+        draw_inbetween_settings(self.layout, inbetween_rows_find(key.in_betweens, shape.name))
@@ -3,6 +3,9 @@ from typing import Set, TYPE_CHECKING
 from bpy.types import Operator
 from bpy.props import StringProperty
 from ..lib.asks import COMPAT_ENGINES, COMPAT_OBJECTS
+from ..app.curves import curve_points_assign, curve_points_data
+from ..app.scheduler import deferred_updates
+from .base import selected_shape_keys
 if TYPE_CHECKING:
     from bpy.types import Context
 
@@ -113,3 +116,59 @@ class INBETWEEN_OT_activation_value_actions(Operator):
 
         context.window_manager.popup_menu(draw)
         return {'FINISHED'}
+
+
+class INBETWEEN_OT_activation_copy_to_selected(Operator):
+
+    bl_idname = 'in_betweens.activation_copy_to_selected'
+    bl_label = "Copy Activation To Selected"
+    bl_description = ("Copy the activation settings of the active in-between to the closest "
+                      "in-between of the same hero on every selected object")
+    bl_options = {'INTERNAL', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return INBETWEEN_OT_activate.poll(context)
+
+    def execute(self, context: 'Context') -> Set[str]:
+        shape = context.object.active_shape_key
+        source = shape.id_data.in_betweens[shape]
+        hero = source.hero
+        if hero is None:
+            self.report({'ERROR'}, "In-between has no hero")
+            return {'CANCELLED'}
+
+        act = source.activation
+        center = act.center
+        range_min = act.range_min
+        range_max = act.range_max
+        target = act.target
+        curve = curve_points_data(act.curve.points)
+        count = 0
+
+        with deferred_updates():
+            for _, other in selected_shape_keys(context, hero.name):
+                key = other.id_data
+                if key == shape.id_data or not key.is_property_set("in_betweens"):
+                    continue
+
+                heros = key.in_betweens.heros
+                if other not in heros:
+                    continue
+
+                inbetweens = heros[other].in_betweens
+                if not inbetweens:
+                    continue
+
+                inbetween = min(inbetweens, key=lambda item: abs(item.activation.center - center))
+                activation = inbetween.activation
+                activation["range_min"] = range_min
+                activation["range_max"] = range_max
+                activation["target"] = target
+                activation.center = center
+                curve_points_assign(activation.curve.points, curve)
+                activation.update()
+                count += 1
+
+        self.report({'INFO'}, f'Updated {count} in-betweens')
+        return {'FINISHED'}
@@ -1,11 +1,18 @@
 
-from typing import TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
+from bpy.props import EnumProperty
 if TYPE_CHECKING:
-    from bpy.types import Context
+    from bpy.types import Context, Object, ShapeKey
 
 COMPAT_ENGINES = {'BLENDER_RENDER', 'BLENDER_EEVEE', 'BLENDER_WORKBENCH'}
 COMPAT_OBJECTS = {'MESH', 'LATTICE', 'CURVE', 'SURFACE'}
 
+SEED_ITEMS = [
+    ('BASIS', "Basis", "Start from a copy of the basis shape"),
+    ('HERO', "Hero", "Start from the hero's shape scaled to the activation value"),
+    ('MIX', "Mix", "Start from the current mix of all shape keys"),
+    ]
+
 class Base:
 
     @classmethod
@@ -16,3 +23,34 @@ class Base:
                 shape = object.active_shape_key
                 return shape is not None and shape != shape.id_data.reference_key
         return False
+
+
+def selected_shape_keys(context: 'Context', name: str) -> List[Tuple['Object', 'ShapeKey']]:
+    """Returns (object, shape key) pairs for the selected objects (and the active object) with
+    a shape key named name. Objects sharing a Key are only included once.
+    """
+    result = []
+    seen = set()
+    objects = list(context.selected_objects)
+    if context.object is not None and context.object not in objects:
+        objects.insert(0, context.object)
+
+    for object in objects:
+        if object.type in COMPAT_OBJECTS:
+            key = object.data.shape_keys
+            if key is not None and key not in seen:
+                shape = key.key_blocks.get(name)
+                if shape is not None:
+                    seen.add(key)
+                    result.append((object, shape))
+    return result
+
+
+def seed_property() -> EnumProperty:
+    return EnumProperty(
+        name="Shape",
+        description="The shape new in-between shape keys start from",
+        items=SEED_ITEMS,
+        default='BASIS',
+        options=set()
+        )
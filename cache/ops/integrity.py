@@ -0,0 +1,36 @@
+
+from typing import Set, TYPE_CHECKING
+from bpy.types import Operator
+from bpy.props import BoolProperty
+from ..app.integrity import check_all
+if TYPE_CHECKING:
+    from bpy.types import Context
+
+
+class INBETWEEN_OT_check(Operator):
+
+    bl_idname = 'in_betweens.check'
+    bl_label = "Check In-Betweens"
+    bl_description = "Check the in-between data of every shape key datablock for problems"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    repair: BoolProperty(
+        name="Repair",
+        description="Fix the problems found",
+        default=False,
+        options=set()
+        )
+
+    def execute(self, context: 'Context') -> Set[str]:
+        issues = check_all(self.repair)
+        for issue in issues:
+            name = f'{issue.key}: {issue.name}' if issue.name and issue.name != issue.key else issue.key
+            self.report({'WARNING'}, f'{name}: {issue.message}' if name else issue.message)
+
+        if not issues:
+            self.report({'INFO'}, "No problems found")
+        elif self.repair:
+            self.report({'INFO'}, f'Repaired {len(issues)} problems')
+        else:
+            self.report({'WARNING'}, f'Found {len(issues)} problems')
+        return {'FINISHED'}
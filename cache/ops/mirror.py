@@ -0,0 +1,46 @@
+
+from typing import Set, TYPE_CHECKING
+from bpy.types import Operator
+from bpy.props import BoolProperty, EnumProperty
+from ..lib.asks import COMPAT_ENGINES, COMPAT_OBJECTS
+if TYPE_CHECKING:
+    from bpy.types import Context
+
+
+class INBETWEEN_OT_mirror(Operator):
+
+    bl_idname = 'in_betweens.mirror'
+    bl_label = "Mirror In-Betweens"
+    bl_description = "Create or update the in-betweens of the opposite side for every hero on one side"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    side: EnumProperty(
+        name="From",
+        items=[
+            ('L', "Left", "Mirror in-betweens of left side heros to the right side"),
+            ('R', "Right", "Mirror in-betweens of right side heros to the left side"),
+            ],
+        default='L',
+        options=set()
+        )
+
+    shapes: BoolProperty(
+        name="Mirror Shapes",
+        description="Mirror the in-between shapes across the X axis",
+        default=True,
+        options=set()
+        )
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        if context.engine in COMPAT_ENGINES:
+            object = context.object
+            if object is not None and object.type in COMPAT_OBJECTS:
+                key = object.data.shape_keys
+                return key is not None and key.is_property_set("in_betweens")
+        return False
+
+    def execute(self, context: 'Context') -> Set[str]:
+        created, updated = context.object.data.shape_keys.in_betweens.mirror(self.side, self.shapes)
+        self.report({'INFO'}, f'Created {created} and updated {updated} in-betweens')
+        return {'FINISHED'}
@@ -1,9 +1,11 @@
 
 from typing import Set, TYPE_CHECKING
 from bpy.types import Operator
+from bpy.props import FloatProperty, IntProperty
 from ..lib.asks import COMPAT_ENGINES, COMPAT_OBJECTS
+from .base import seed_property, selected_shape_keys
 if TYPE_CHECKING:
-    from bpy.types import Context
+    from bpy.types import Context, Event
 
 
 class INBETWEEN_OT_new(Operator):
@@ -13,6 +15,8 @@ class INBETWEEN_OT_new(Operator):
     bl_description = "Add a new in-between shape key"
     bl_options = {'INTERNAL', 'UNDO'}
 
+    seed: seed_property()
+
     @classmethod
     def poll(cls, context: 'Context') -> bool:
         if context.engine in COMPAT_ENGINES:
@@ -24,5 +28,76 @@ class INBETWEEN_OT_new(Operator):
 
     def execute(self, context: 'Context') -> Set[str]:
         hero = context.object.active_shape_key
-        hero.id_data.in_betweens.new(hero)
+        hero.id_data.in_betweens.new(hero, seed=self.seed)
+        return {'FINISHED'}
+
+
+class INBETWEEN_OT_new_many(Operator):
+
+    bl_idname = 'in_between.new_many'
+    bl_label = "New In-Betweens"
+    bl_description = "Add several in-between shape keys spaced evenly across the hero's range"
+    bl_options = {'INTERNAL', 'UNDO'}
+
+    count: IntProperty(
+        name="Count",
+        description="The number of in-betweens to add",
+        min=1,
+        soft_max=10,
+        default=3,
+        options=set()
+        )
+
+    target: FloatProperty(
+        name="Target",
+        description="The value of each in-between when fully activated",
+        min=0.0,
+        max=10.0,
+        default=1.0,
+        precision=3,
+        options=set()
+        )
+
+    seed: seed_property()
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return INBETWEEN_OT_new.poll(context)
+
+    def invoke(self, context: 'Context', _: 'Event') -> Set[str]:
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context: 'Context') -> Set[str]:
+        hero = context.object.active_shape_key
+        rmin = hero.slider_min
+        step = (hero.slider_max - rmin) / (self.count + 1)
+        centers = [(rmin + step * (i + 1), self.target) for i in range(self.count)]
+        hero.id_data.in_betweens.new_many(hero, centers, seed=self.seed)
+        return {'FINISHED'}
+
+
+class INBETWEEN_OT_new_selected(Operator):
+
+    bl_idname = 'in_between.new_selected'
+    bl_label = "New In-Between On Selected"
+    bl_description = ("Add a new in-between to the active shape key's hero on every selected object "
+                      "with a shape key of the same name")
+    bl_options = {'INTERNAL', 'UNDO'}
+
+    seed: seed_property()
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return INBETWEEN_OT_new.poll(context)
+
+    def execute(self, context: 'Context') -> Set[str]:
+        active = context.object.active_shape_key
+        center = active.value
+        count = 0
+
+        for _, hero in selected_shape_keys(context, active.name):
+            hero.id_data.in_betweens.new_many(hero, [center], seed=self.seed)
+            count += 1
+
+        self.report({'INFO'}, f'Added in-betweens to {count} objects')
         return {'FINISHED'}
@@ -0,0 +1,28 @@
+
+from typing import Set, TYPE_CHECKING
+from bpy.types import Operator
+from ..lib.asks import COMPAT_ENGINES, COMPAT_OBJECTS
+if TYPE_CHECKING:
+    from bpy.types import Context
+
+
+class INBETWEEN_OT_regroup(Operator):
+
+    bl_idname = 'in_betweens.regroup'
+    bl_label = "Regroup In-Betweens"
+    bl_description = "Move every in-between shape key below its hero, ordered by activation center"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        if context.engine in COMPAT_ENGINES:
+            object = context.object
+            if object is not None and object.type in COMPAT_OBJECTS:
+                key = object.data.shape_keys
+                return key is not None and key.is_property_set("in_betweens")
+        return False
+
+    def execute(self, context: 'Context') -> Set[str]:
+        count = context.object.data.shape_keys.in_betweens.regroup()
+        self.report({'INFO'}, f'Moved {count} shape keys')
+        return {'FINISHED'}
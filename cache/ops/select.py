@@ -6,7 +6,9 @@ from bpy.props import CollectionProperty, StringProperty
 from .base import Base
 from ..api.in_between import InBetween
 from ..api.target import Target
-from ..lib.driver_utils import driver_ensure, driver_find
+from ..app.candidates import candidates
+from ..app.driver_index import driver_index_invalidate
+from ..lib.driver_utils import driver_ensure
 if TYPE_CHECKING:
     from bpy.types import Context, Event
 
@@ -31,20 +33,12 @@ class INBETWEEN_OT_select(Base, Operator):
         )
 
     def invoke(self, context: 'Context', _: 'Event') -> Set[str]:
-        object = context.object
-        hero = object.active_shape_key
-        key = hero.id_data
-        ref = object.reference_key
-
+        hero = context.object.active_shape_key
         targets = self.targets
         targets.clear()
 
-        for shape in key.key_blocks:
-            if (shape != hero
-                and shape != ref
-                and not driver_find(key, f'key_blocks["{shape.name}"].value')
-                ):
-                targets.add().name = shape.name
+        for name in candidates(hero.id_data, hero.name):
+            targets.add().name = name
 
         self.target = ""
         return context.window_manager.invoke_props_dialog(self)
@@ -91,6 +85,7 @@ class INBETWEEN_OT_select(Base, Operator):
             var.targets[0].id_type = 'KEY'
             var.targets[0].id = key
             var.targets[0].data_path = f'key_blocks["{hero.name}"].value'
+            driver_index_invalidate(key)
 
             inbtwn.update()
             inbetweens.active_index = len(inbetweens)-1
@@ -30,10 +30,15 @@ bl_info = {
 
 UPDATE_URL = ""
 
-from typing import Set
+from typing import Optional, Sequence, Set, Tuple
 import bpy
 from .lib import asks
+from .preferences import InBetweenPreferences
+from .shapes import seed_property
+from .stats import instrumented
 
+# Submodules are imported where they are first used so that registering the add-on does not
+# pay for NumPy and the modules only needed by UI operators.
 
 def draw_inbetween(layout: bpy.types.UILayout, entity: asks.types.Entity) -> None:
     components = entity.components
@@ -70,6 +75,14 @@ class NewInBetween(bpy.types.Operator):
     bl_description = ""
     bl_options = {'INTERNAL', 'UNDO'}
 
+    name: bpy.props.StringProperty(
+        name="Name",
+        default="In-Between",
+        options=set()
+        )
+
+    seed: seed_property()
+
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
         if asks.utils.validate_context(context):
@@ -83,46 +96,102 @@ class NewInBetween(bpy.types.Operator):
     def execute(self, context: bpy.types.Context) -> Set[str]:
         object = context.object
         k_hero = object.active_shape_key
-        system = k_hero.id_data.asks
-
-        e_owner = system.entities.ensure(k_hero)
-        c_owner = e_owner.shape()
-
-        c_curve = system.components.create("inbetweens.curve",
-                                           label="Curve")
-
-        c_value = system.components.create("inbetweens.value",
-                                           label="Target Value",
-                                           value=1.0)
+        inbetween_create(object, k_hero, self.name, k_hero.slider_min, k_hero.value, seed=self.seed)
+        return {'FINISHED'}
 
-        c_range = system.components.create("inbetweens.range",
-                                           min=k_hero.slider_min,
-                                           max=k_hero.value,
-                                           label="Range",
-                                           label_min="Start",
-                                           label_max="Finish")
 
-        k_inbtw = object.shape_key_add(name=self.name, from_mix=False)
-        e_inbtw = system.entities.create(k_inbtw, type="INBETWEEN", draw=draw_inbetween)
-        e_inbtw.tags.add('INBETWEEN')
+class NewInBetweenSelected(bpy.types.Operator):
 
-        e_inbtw.components.attach(c_owner, name="owner")
-        e_inbtw.components.attach(c_curve, name="curve")
-        e_inbtw.components.attach(c_range, name="range")
-        e_inbtw.components.attach(c_value, name="value")
+    bl_idname = "inbetweens.new_selected"
+    bl_label = "New In-Between On Selected"
+    bl_description = "Add an in-between to every selected object with a shape key named like the active one"
+    bl_options = {'INTERNAL', 'UNDO'}
 
-        e_inbtw.processors.assign(inbetween_rename, c_owner)
-        e_inbtw.processors.assign(inbetween_driver_update, c_owner)
-        e_inbtw.processors.assign(inbetween_fcurve_update, c_range, c_value, c_curve)
+    name: bpy.props.StringProperty(
+        name="Name",
+        default="In-Between",
+        options=set()
+        )
 
-        e_owner.children.append(e_inbtw)
+    seed: seed_property()
 
-        inbetween_driver_update(e_inbtw, c_owner)
-        inbetween_fcurve_update(e_inbtw, c_range, c_value, c_curve)
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        return NewInBetween.poll(context)
 
+    def execute(self, context: bpy.types.Context) -> Set[str]:
+        active = context.object.active_shape_key
+        range_min = active.slider_min
+        range_max = active.value
+        keys = set()
+
+        for object in [context.object] + [x for x in context.selected_objects if x != context.object]:
+            if asks.utils.supports_shape_keys(object):
+                key = object.data.shape_keys
+                if key is not None and key not in keys:
+                    k_hero = key.key_blocks.get(active.name)
+                    if k_hero is not None and k_hero != key.reference_key:
+                        keys.add(key)
+                        inbetween_create(object, k_hero, self.name, range_min, range_max, seed=self.seed)
+
+        self.report({'INFO'}, f'Added in-betweens to {len(keys)} objects')
         return {'FINISHED'}
 
 
+def inbetween_create(object: bpy.types.Object,
+                     k_hero: bpy.types.ShapeKey,
+                     name: str,
+                     range_min: float,
+                     range_max: float,
+                     value: Optional[float]=1.0,
+                     curve: Optional[Sequence[Tuple[float, float, str]]]=None,
+                     seed: Optional[str]='BASIS') -> asks.types.Entity:
+    system = k_hero.id_data.asks
+
+    e_owner = system.entities.ensure(k_hero)
+    c_owner = e_owner.shape()
+
+    c_curve = system.components.create("inbetweens.curve",
+                                       label="Curve")
+    if curve is not None:
+        from .curves import curve_points_assign
+        curve_points_assign(c_curve.points, curve)
+
+    c_value = system.components.create("inbetweens.value",
+                                       label="Target Value",
+                                       value=value)
+
+    c_range = system.components.create("inbetweens.range",
+                                       min=range_min,
+                                       max=range_max,
+                                       label="Range",
+                                       label_min="Start",
+                                       label_max="Finish")
+
+    k_inbtw = object.shape_key_add(name=name, from_mix=seed == 'MIX')
+    if seed == 'HERO':
+        from .shapes import shape_key_seed
+        shape_key_seed(k_inbtw, k_hero, range_max)
+    e_inbtw = system.entities.create(k_inbtw, type="INBETWEEN", draw=draw_inbetween)
+    e_inbtw.tags.add('INBETWEEN')
+
+    e_inbtw.components.attach(c_owner, name="owner")
+    e_inbtw.components.attach(c_curve, name="curve")
+    e_inbtw.components.attach(c_range, name="range")
+    e_inbtw.components.attach(c_value, name="value")
+
+    e_inbtw.processors.assign(inbetween_rename, c_owner)
+    e_inbtw.processors.assign(inbetween_driver_update, c_owner)
+    e_inbtw.processors.assign(inbetween_fcurve_update, c_range, c_value, c_curve)
+
+    e_owner.children.append(e_inbtw)
+
+    inbetween_driver_update(e_inbtw, c_owner)
+    inbetween_fcurve_update(e_inbtw, c_range, c_value, c_curve)
+    return e_inbtw
+
+
+@instrumented
 def inbetween_rename(e_inbetween: asks.types.Entity,
                      c_owner: asks.types.ShapeComponent,
                      c_range: asks.types.RangeComponent) -> None:
@@ -131,49 +200,63 @@ def inbetween_rename(e_inbetween: asks.types.Entity,
         k_inbetween.name = f'{c_owner.value}_{c_range.max:.2f}'
 
 
+@instrumented
 def inbetween_fcurve_update(e_inbtw: asks.types.Entity,
                             c_range: asks.types.RangeComponent,
                             c_value: asks.types.ValueComponent,
                             c_curve: asks.types.CurveComponent) -> None:
+    from .engine import to_bezier_batch
+    from .keyframes import keyframe_points_sync
     fcurve = e_inbtw.fcurve(True)
-    points = c_curve.points.to_bezier(range_x=(c_range.min, c_range.max),
-                                      range_y=(0.0, c_value.value),
-                                      extrapolate=False)
-    asks.utils.set_keyframe_points(fcurve, points)
+    curve = c_curve.points
+    data, counts = to_bezier_batch((curve,),
+                                   lambda _, x, y: curve.to_bezier(range_x=x, range_y=y, extrapolate=False),
+                                   ranges_x=((c_range.min, c_range.max),),
+                                   ranges_y=((0.0, c_value.value),))
+    points = data[0, :counts[0]]
+    keyframe_points_sync(fcurve, points)
 
 
+@instrumented
 def inbetween_driver_update(e_inbtw: asks.types.Entity,
                             c_owner: asks.types.ShapeComponent) -> None:
-    driver = e_inbtw.driver(True)
+    from .drivers import driver_variables_sync
+    paths = [param.data_path for param in e_inbtw.parameters]
+    paths.append(f'key_blocks["{c_owner.value}"].value')
+
+    targets = [(f'var_{str(index).zfill(3)}', path) for index, path in enumerate(paths, 1)]
+    expression = "*".join(name for name, _ in targets)
+
+    driver_variables_sync(e_inbtw.driver(True), e_inbtw.id_data, targets, expression)
 
-    variables = driver.variables
-    while len(variables):
-        variables.remove(variables[-1])
 
-    for param in e_inbtw.parameters:
-        variable = variables.new()
-        variable.type = 'SINGLE_PROP'
-        variable.name = f'var_{str(len(variables)).zfill(3)}'
+_registered = []
 
-        target = variable.targets[0]
-        target.id_type = 'KEY'
-        target.id = e_inbtw.id_data
-        target.data_path = param.data_path
 
-    variable = variables.new()
-    variable.type = 'SINGLE_PROP'
-    variable.name = f'var_{str(len(variables)).zfill(3)}'
+def ui_classes() -> Tuple[type, ...]:
+    from .bake import BakeInBetweens, UnbakeInBetweens
+    from .serialize import ExportInBetweens, ImportInBetweens
+    return (
+        BakeInBetweens,
+        UnbakeInBetweens,
+        ExportInBetweens,
+        ImportInBetweens,
+        )
 
-    target = variable.targets[0]
-    target.id_type = 'KEY'
-    target.id = e_inbtw.id_data
-    target.data_path = f'key_blocks["{c_owner.value}"].value'
 
-    driver.type = 'SCRIPTED'
-    driver.expression = "*".join(variables.keys())
+def register_deferred() -> None:
+    """Registers the UI operators skipped by register() in background mode. Scripts can
+    call this to use them, or use the bake and serialize module functions directly.
+    """
+    if not _registered:
+        for cls in ui_classes():
+            bpy.utils.register_class(cls)
+            _registered.append(cls)
 
 
 def register():
+    bpy.utils.register_class(InBetweenPreferences)
+
     ns = asks.utils.namespace("inbetweens")
     ns.add_component("value", asks.types.ValueComponent)
     ns.add_component("range", asks.types.RangeComponent)
@@ -182,8 +265,16 @@ def register():
     ns.add_processor(inbetween_driver_update)
     ns.add_processor(inbetween_fcurve_update)
     ns.add_context_menu_item(NewInBetween)
+    ns.add_context_menu_item(NewInBetweenSelected)
     ns.register()
 
+    if not bpy.app.background:
+        register_deferred()
+
 
 def unregister():
+    while _registered:
+        bpy.utils.unregister_class(_registered.pop())
+
     asks.utils.namespace("inbetweens").unregister()
+    bpy.utils.unregister_class(InBetweenPreferences)
@@ -0,0 +1,212 @@
+
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+import numpy as np
+import bpy
+from .engine import bezier_arrays, bezier_evaluate
+from .lib import asks
+if TYPE_CHECKING:
+    from bpy.types import Context, FCurve, Key, Scene
+
+BAKED_PROPERTY = "in_betweens_baked"
+BAKED_ACTION_GROUP = "In-Betweens (Baked)"
+
+
+def driver_keyframe_array(fcurve: 'FCurve') -> np.ndarray:
+    keyframes = fcurve.keyframe_points
+    count = len(keyframes)
+    data = np.empty((3, count * 2), dtype=np.float32)
+    keyframes.foreach_get("co", data[0])
+    keyframes.foreach_get("handle_left", data[1])
+    keyframes.foreach_get("handle_right", data[2])
+    return data.reshape(3, count, 2).transpose(1, 0, 2)
+
+
+def bakeable_drivers(key: 'Key') -> List[Tuple[str, 'FCurve', List[str]]]:
+    """Returns (data_path, driver F-Curve, input data paths) for each in-between on the Key
+    whose driver multiplies single property inputs from the Key itself.
+    """
+    result = []
+    animdata = key.animation_data
+    if animdata is None:
+        return result
+
+    drivers = animdata.drivers
+    for entity in key.asks.entities:
+        if 'INBETWEEN' not in entity.tags:
+            continue
+
+        shape = entity.shape().resolve()
+        if shape is None:
+            continue
+
+        path = shape.path_from_id("value")
+        fcurve = drivers.find(path)
+        if fcurve is None:
+            continue
+
+        driver = fcurve.driver
+        variables = driver.variables
+        if (driver.type != 'SCRIPTED'
+                or driver.expression != "*".join(variables.keys())
+                or any(v.type != 'SINGLE_PROP' or v.targets[0].id != key for v in variables)):
+            continue
+
+        result.append((path, fcurve, [v.targets[0].data_path for v in variables]))
+    return result
+
+
+def bake(key: 'Key',
+         frame_start: int,
+         frame_end: int,
+         step: Optional[int]=1,
+         scene: Optional['Scene']=None) -> int:
+    """Samples the in-betweens of the Key over the frame range and writes the results as
+    keyframes in the Key's action, muting the in-between drivers. Returns the number of
+    in-betweens baked.
+    """
+    entries = [entry for entry in bakeable_drivers(key) if not entry[1].mute]
+    if not entries:
+        return 0
+
+    scene = scene or bpy.context.scene
+    frames = np.arange(frame_start, frame_end + 1, max(1, step), dtype=np.float64)
+
+    paths = sorted({path for _, _, inputs in entries for path in inputs})
+    lookup = {path: index for index, path in enumerate(paths)}
+
+    # One extra column of ones pads in-betweens with fewer inputs
+    values = np.ones((len(frames), len(paths) + 1), dtype=np.float64)
+    current = scene.frame_current
+    for row, frame in enumerate(frames):
+        scene.frame_set(int(frame))
+        values[row, :-1] = [key.path_resolve(path) for path in paths]
+    scene.frame_set(current)
+
+    width = max(len(inputs) for _, _, inputs in entries)
+    indices = np.full((len(entries), width), len(paths), dtype=np.int64)
+    for row, (_, _, inputs) in enumerate(entries):
+        indices[row, :len(inputs)] = [lookup[path] for path in inputs]
+
+    x = values[:, indices].prod(axis=-1).T
+    data, counts = bezier_arrays([driver_keyframe_array(fcurve) for _, fcurve, _ in entries])
+    y = np.where(counts[:, None] > 0, bezier_evaluate(data, counts, x), x)
+
+    animdata = key.animation_data
+    action = animdata.action
+    if action is None:
+        action = animdata.action = bpy.data.actions.new(f'{key.name}Action')
+
+    baked = set(key.get(BAKED_PROPERTY, ()))
+    buffer = np.empty((len(frames), 2), dtype=np.float32)
+    buffer[:, 0] = frames
+
+    for row, (path, driver, _) in enumerate(entries):
+        fcurve = action.fcurves.find(path)
+        if fcurve is None:
+            fcurve = action.fcurves.new(path, action_group=BAKED_ACTION_GROUP)
+        else:
+            fcurve.keyframe_points.clear()
+
+        buffer[:, 1] = y[row]
+        fcurve.keyframe_points.add(len(frames))
+        fcurve.keyframe_points.foreach_set("co", buffer.ravel())
+        fcurve.update()
+
+        driver.mute = True
+        baked.add(path)
+
+    key[BAKED_PROPERTY] = sorted(baked)
+    return len(entries)
+
+
+def unbake(key: 'Key') -> int:
+    """Removes baked in-between keyframes from the Key and unmutes their drivers. Returns the
+    number of in-betweens restored.
+    """
+    paths = list(key.get(BAKED_PROPERTY, ()))
+    animdata = key.animation_data
+    if animdata is not None:
+        action = animdata.action
+        for path in paths:
+            if action is not None:
+                fcurve = action.fcurves.find(path)
+                if fcurve is not None:
+                    action.fcurves.remove(fcurve)
+            driver = animdata.drivers.find(path)
+            if driver is not None:
+                driver.mute = False
+
+    if BAKED_PROPERTY in key:
+        del key[BAKED_PROPERTY]
+    return len(paths)
+
+
+def context_keys(context: 'Context') -> Set['Key']:
+    keys = set()
+    for object in context.selected_objects or (context.object,):
+        if object is not None and asks.utils.supports_shape_keys(object):
+            key = object.data.shape_keys
+            if key is not None:
+                keys.add(key)
+    return keys
+
+
+class BakeInBetweens(bpy.types.Operator):
+
+    bl_idname = "inbetweens.bake"
+    bl_label = "Bake In-Betweens"
+    bl_description = "Bake in-between activations of the selected objects to keyframes and mute their drivers"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: bpy.props.IntProperty(
+        name="Start Frame",
+        default=1,
+        options=set()
+        )
+
+    frame_end: bpy.props.IntProperty(
+        name="End Frame",
+        default=250,
+        options=set()
+        )
+
+    step: bpy.props.IntProperty(
+        name="Frame Step",
+        min=1,
+        default=1,
+        options=set()
+        )
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return bool(context_keys(context))
+
+    def invoke(self, context: 'Context', _) -> Set[str]:
+        scene = context.scene
+        self.frame_start = scene.frame_start
+        self.frame_end = scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context: 'Context') -> Set[str]:
+        count = 0
+        for key in context_keys(context):
+            count += bake(key, self.frame_start, self.frame_end, self.step, context.scene)
+        self.report({'INFO'}, f'Baked {count} in-betweens')
+        return {'FINISHED'}
+
+
+class UnbakeInBetweens(bpy.types.Operator):
+
+    bl_idname = "inbetweens.unbake"
+    bl_label = "Unbake In-Betweens"
+    bl_description = "Remove baked in-between keyframes of the selected objects and restore their drivers"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return any(BAKED_PROPERTY in key for key in context_keys(context))
+
+    def execute(self, context: 'Context') -> Set[str]:
+        count = sum(unbake(key) for key in context_keys(context))
+        self.report({'INFO'}, f'Restored {count} in-betweens')
+        return {'FINISHED'}
@@ -0,0 +1,66 @@
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .keyframes import Point
+
+BEZIER_CACHE_SIZE = 256
+
+
+class BezierCache:
+    """Least-recently-used cache of Bezier conversions of curves normalized to the unit square"""
+
+    def __init__(self, maxsize: int=BEZIER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Tuple[Point, ...]]' = OrderedDict()
+
+    def get(self, signature: Hashable, convert: Callable[[], Iterable['Point']]) -> Tuple['Point', ...]:
+        data = self._data
+        points = data.get(signature)
+        if points is not None:
+            data.move_to_end(signature)
+            self.hits += 1
+            return points
+
+        self.misses += 1
+        points = data[signature] = tuple((tuple(co), tuple(hl), tuple(hr)) for co, hl, hr in convert())
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+        return points
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            }
+
+
+bezier_cache = BezierCache()
+
+
+def curve_signature(points: Iterable) -> Tuple:
+    return tuple((tuple(point.location), point.handle_type) for point in points)
+
+
+def curve_points_data(points: Iterable) -> List[Tuple[float, float, str]]:
+    return [(point.location[0], point.location[1], point.handle_type) for point in points]
+
+
+def curve_points_assign(points, data: Sequence[Sequence]) -> None:
+    """Replaces a curve's points with data, a sequence of (x, y, handle_type) tuples"""
+    while len(points) > len(data):
+        points.remove(points[-1])
+    while len(points) < len(data):
+        points.new(0.0, 0.0)
+    for point, (x, y, handle_type) in zip(points, data):
+        point.location = (x, y)
+        point.handle_type = handle_type
@@ -0,0 +1,54 @@
+
+from typing import Sequence, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from bpy.types import Driver, ID
+
+
+def driver_variables_sync(driver: 'Driver',
+                          id: 'ID',
+                          targets: Sequence[Tuple[str, str]],
+                          expression: str,
+                          id_type: str='KEY') -> bool:
+    """Brings the driver's single property variables in line with targets, a sequence of
+    (name, data_path) pairs, touching only the variables that differ. The driver type and
+    expression are only assigned when they change. Returns True if anything was modified.
+    """
+    changed = False
+    variables = driver.variables
+    names = {name for name, _ in targets}
+
+    for name in [name for name in variables.keys() if name not in names]:
+        variables.remove(variables[name])
+        changed = True
+
+    for name, path in targets:
+        variable = variables.get(name)
+        if variable is None:
+            variable = variables.new()
+            variable.type = 'SINGLE_PROP'
+            variable.name = name
+            changed = True
+        elif variable.type != 'SINGLE_PROP':
+            variable.type = 'SINGLE_PROP'
+            changed = True
+
+        target = variable.targets[0]
+        if target.id_type != id_type:
+            target.id_type = id_type
+            changed = True
+        if target.id != id:
+            target.id = id
+            changed = True
+        if target.data_path != path:
+            target.data_path = path
+            changed = True
+
+    if driver.type != 'SCRIPTED':
+        driver.type = 'SCRIPTED'
+        changed = True
+
+    if driver.expression != expression:
+        driver.expression = expression
+        changed = True
+
+    return changed
@@ -0,0 +1,104 @@
+
+from typing import Callable, Iterable, Sequence, Tuple
+import numpy as np
+from .curves import bezier_cache, curve_signature
+from .keyframes import Point
+
+BISECTION_STEPS = 24
+
+
+def bezier_arrays(curves: Sequence[Sequence[Point]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Packs Bezier curves into a contiguous (N, K, 3, 2) float array of (co, handle_left,
+    handle_right) points, padded with each curve's last point, and an (N,) array of counts.
+    """
+    counts = np.fromiter((len(points) for points in curves), dtype=np.int32, count=len(curves))
+    size = int(counts.max()) if len(counts) else 0
+    data = np.zeros((len(curves), size, 3, 2), dtype=np.float64)
+    for index, points in enumerate(curves):
+        if len(points):
+            count = len(points)
+            data[index, :count] = points
+            data[index, count:] = data[index, count - 1]
+    return data, counts
+
+
+def bezier_remap_batch(data: np.ndarray,
+                       ranges_x: np.ndarray,
+                       ranges_y: np.ndarray) -> np.ndarray:
+    """Maps unit-range Bezier arrays (N, K, 3, 2) into per-curve (N, 2) x and y ranges"""
+    ranges_x = np.asarray(ranges_x, dtype=np.float64).reshape(-1, 2)
+    ranges_y = np.asarray(ranges_y, dtype=np.float64).reshape(-1, 2)
+    offset = np.stack((ranges_x[:, 0], ranges_y[:, 0]), axis=-1)
+    scale = np.stack((ranges_x[:, 1] - ranges_x[:, 0], ranges_y[:, 1] - ranges_y[:, 0]), axis=-1)
+    return np.ascontiguousarray(data * scale[:, None, None, :] + offset[:, None, None, :])
+
+
+def to_bezier_batch(curves: Iterable[Iterable],
+                    convert: Callable[[int, Tuple[float, float], Tuple[float, float]], Iterable[Point]],
+                    ranges_x: np.ndarray,
+                    ranges_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts N curves to Bezier arrays in one call. convert(index, range_x, range_y)
+    converts the curve at index and is only called for curve shapes missing from the shared
+    Bezier cache. Returns the (N, K, 3, 2) array of points and the (N,) array of counts.
+    """
+    unit = (0.0, 1.0)
+    normalized = []
+    for index, points in enumerate(curves):
+        normalized.append(bezier_cache.get(curve_signature(points),
+                                           lambda index=index: convert(index, unit, unit)))
+    data, counts = bezier_arrays(normalized)
+    return bezier_remap_batch(data, ranges_x, ranges_y), counts
+
+
+def bezier_evaluate(data: np.ndarray, counts: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Evaluates N Bezier curves (as returned by to_bezier_batch) at M x values, shared by all
+    curves as an (M,) array or per curve as an (N, M) array, holding the first and last values
+    constant outside each curve. Returns an (N, M) array.
+    """
+    count = len(data)
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim < 2:
+        x = np.broadcast_to(x.reshape(-1), (count, x.size))
+    if count == 0 or data.shape[1] == 0:
+        return np.zeros(x.shape, dtype=np.float64)
+
+    rows = np.arange(count)[:, None]
+    knots = data[:, :, 0, 0]
+    last = np.maximum(counts.astype(np.int64) - 1, 0)[:, None]
+
+    segment = (x[:, :, None] >= knots[:, None, 1:]).sum(axis=-1)
+    segment = np.minimum(segment, np.maximum(last - 1, 0))
+    following = np.minimum(segment + 1, last)
+
+    p0 = data[rows, segment, 0]
+    p1 = data[rows, segment, 2]
+    p2 = data[rows, following, 1]
+    p3 = data[rows, following, 0]
+
+    lo = np.zeros(segment.shape)
+    hi = np.ones(segment.shape)
+    target = np.clip(x, p0[..., 0], p3[..., 0])
+
+    for _ in range(BISECTION_STEPS):
+        t = (lo + hi) * 0.5
+        u = 1.0 - t
+        bx = (u * u * u * p0[..., 0]
+              + 3.0 * u * u * t * p1[..., 0]
+              + 3.0 * u * t * t * p2[..., 0]
+              + t * t * t * p3[..., 0])
+        below = bx < target
+        lo = np.where(below, t, lo)
+        hi = np.where(below, hi, t)
+
+    t = (lo + hi) * 0.5
+    u = 1.0 - t
+    y = (u * u * u * p0[..., 1]
+         + 3.0 * u * u * t * p1[..., 1]
+         + 3.0 * u * t * t * p2[..., 1]
+         + t * t * t * p3[..., 1])
+
+    first = data[:, 0, 0]
+    final = data[np.arange(count), last[:, 0], 0]
+    y = np.where(x <= first[:, None, 0], first[:, None, 1], y)
+    y = np.where(x >= final[:, None, 0], final[:, None, 1], y)
+    return np.ascontiguousarray(y)
@@ -0,0 +1,56 @@
+
+from typing import Sequence, Tuple, Union, TYPE_CHECKING
+import numpy as np
+if TYPE_CHECKING:
+    from bpy.types import FCurve
+
+Point = Tuple[Sequence[float], Sequence[float], Sequence[float]]
+
+KEYFRAME_ATTRIBUTES = ("co", "handle_left", "handle_right")
+
+
+def keyframe_points_sync(fcurve: 'FCurve', points: Union[Sequence[Point], np.ndarray]) -> bool:
+    """Assigns points, a sequence of (co, handle_left, handle_right) tuples or a (K, 3, 2)
+    array, to the F-Curve's keyframes. Coordinates are read and written in bulk and only
+    attributes that differ from the existing keyframes are written. Returns True if the
+    F-Curve was modified, in which case fcurve.update() has been called.
+    """
+    keyframes = fcurve.keyframe_points
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 3, 2)
+    count = len(points)
+    resized = len(keyframes) != count
+
+    if resized:
+        while len(keyframes) > count:
+            keyframes.remove(keyframes[-1], fast=True)
+        if len(keyframes) < count:
+            keyframes.add(count - len(keyframes))
+
+    # Checked on every call since the user can change them without resizing the F-Curve
+    changed = resized
+    for keyframe in keyframes:
+        if keyframe.interpolation != 'BEZIER':
+            keyframe.interpolation = 'BEZIER'
+            changed = True
+        if keyframe.handle_left_type != 'FREE':
+            keyframe.handle_left_type = 'FREE'
+            changed = True
+        if keyframe.handle_right_type != 'FREE':
+            keyframe.handle_right_type = 'FREE'
+            changed = True
+
+    rewrite = changed
+    for index, attribute in enumerate(KEYFRAME_ATTRIBUTES):
+        values = np.ascontiguousarray(points[:, index]).ravel()
+        if not rewrite:
+            current = np.empty_like(values)
+            keyframes.foreach_get(attribute, current)
+            if np.array_equal(current, values):
+                continue
+        keyframes.foreach_set(attribute, values)
+        changed = True
+
+    if changed:
+        fcurve.update()
+
+    return changed
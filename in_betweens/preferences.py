@@ -0,0 +1,56 @@
+
+from typing import TYPE_CHECKING
+import bpy
+from . import stats
+if TYPE_CHECKING:
+    from bpy.types import Context
+
+
+def preferences_stats_enabled(_: 'InBetweenPreferences') -> bool:
+    return stats.is_enabled()
+
+
+def preferences_stats_enabled_set(_: 'InBetweenPreferences', value: bool) -> None:
+    stats.enable(value)
+
+
+class InBetweenPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    stats_enabled: bpy.props.BoolProperty(
+        name="Collect Statistics",
+        description=("Record call counts and timings of in-between processors and callbacks. "
+                     "Use in_betweens.stats.to_json() to export them from a script"),
+        get=preferences_stats_enabled,
+        set=preferences_stats_enabled_set,
+        options=set()
+        )
+
+    def draw(self, context: 'Context') -> None:
+        layout = self.layout
+        layout.prop(self, "stats_enabled")
+
+        if stats.is_enabled():
+            data = stats.snapshot()
+            functions = sorted(data["functions"].items(), key=lambda item: item[1]["total"], reverse=True)
+
+            col = layout.box().column(align=True)
+            row = col.row()
+            row.label(text="Function")
+            row.label(text="Calls")
+            row.label(text="Total (ms)")
+            row.label(text="Max (ms)")
+            row.label(text="Top Trigger")
+
+            for name, item in functions:
+                triggers = item["triggers"]
+                row = col.row()
+                row.label(text=name.rpartition(".")[2])
+                row.label(text=str(item["count"]))
+                row.label(text=f'{item["total"] * 1000.0:.2f}')
+                row.label(text=f'{item["max"] * 1000.0:.2f}')
+                row.label(text=max(triggers, key=triggers.get) if triggers else "")
+
+            cache = data["bezier_cache"]
+            col.separator()
+            col.label(text=f'Curve cache: {cache["hits"]} hits, {cache["misses"]} misses')
@@ -0,0 +1,229 @@
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+import bpy
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from .curves import curve_points_assign, curve_points_data
+from .lib import asks
+if TYPE_CHECKING:
+    from bpy.types import Context, Key, Object, ShapeKey
+
+FORMAT = "in_betweens"
+VERSION = 1
+
+SYMMETRY_PATTERN = re.compile(r'^(?P<pfix>(?:[LR]|Left|Right)[._\- ])?(?P<base>.*?)(?P<sfix>[._\- ](?:[LR]|Left|Right))?$',
+                              re.IGNORECASE)
+
+
+def symmetry_key(name: str) -> Tuple[str, str]:
+    """Returns the (base, side) of a name, where side is 'l', 'r' or an empty string"""
+    match = SYMMETRY_PATTERN.match(name)
+    side = (match.group("pfix") or match.group("sfix") or "").strip("._- ")[:1].lower()
+    return match.group("base").lower(), side
+
+
+def hero_finder(key: 'Key') -> Callable[[str], Optional['ShapeKey']]:
+    """Returns a function that finds a key block by name or, failing that, by symmetry key"""
+    shapes = key.key_blocks
+    lookup = {}
+    for shape in shapes:
+        lookup.setdefault(symmetry_key(shape.name), shape)
+
+    def find(name: str) -> Optional['ShapeKey']:
+        return shapes.get(name) or lookup.get(symmetry_key(name))
+
+    return find
+
+
+def export_key(key: 'Key') -> Dict[str, Any]:
+    """Serializes the in-betweens of the Key, including legacy in-between data if present"""
+    inbetweens = []
+    for entity in key.asks.entities:
+        if 'INBETWEEN' in entity.tags:
+            components = entity.components
+            shape = entity.shape().resolve()
+            inbetweens.append({
+                "name": shape.name if shape is not None else "",
+                "hero": components["owner"].value,
+                "range": [components["range"].min, components["range"].max],
+                "value": components["value"].value,
+                "curve": curve_points_data(components["curve"].points),
+                })
+
+    legacy = []
+    if hasattr(key, "in_betweens") and key.is_property_set("in_betweens"):
+        heros = {hero.identifier: hero.name for hero in key.in_betweens.heros}
+        for inbetween in key.in_betweens:
+            activation = inbetween.activation
+            legacy.append({
+                "name": inbetween.name,
+                "hero": heros.get(inbetween.get("hero", ""), ""),
+                "center": activation.center,
+                "range": [activation.range_min, activation.range_max],
+                "target": activation.target,
+                "mute": inbetween.mute,
+                "curve": curve_points_data(activation.curve.points),
+                })
+
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "key": key.name,
+        "inbetweens": inbetweens,
+        "legacy": legacy,
+        }
+
+
+def target_name(name: str, source: str, hero: 'ShapeKey') -> str:
+    return hero.name + name[len(source):] if name.startswith(source) else name
+
+
+def import_key(object: 'Object', data: Dict[str, Any]) -> Tuple[int, List[str]]:
+    """Recreates serialized in-betweens on the object's Key, matching heroes by name or
+    symmetry. Returns the number of in-betweens created and the hero names not found.
+    """
+    if data.get("format") != FORMAT:
+        raise ValueError(f'import_key(object, data): Expected {FORMAT} data')
+
+    if data.get("version", 0) > VERSION:
+        raise ValueError((f'import_key(object, data): '
+                          f'Unsupported version {data.get("version")} (expected <= {VERSION})'))
+
+    key = object.data.shape_keys
+    if key is None:
+        raise ValueError(f'import_key(object, data): {object.name} has no shape keys')
+
+    from . import inbetween_create
+
+    find = hero_finder(key)
+    missing = set()
+    count = 0
+
+    for item in data.get("inbetweens", ()):
+        hero = find(item["hero"])
+        if hero is None:
+            missing.add(item["hero"])
+            continue
+        range_min, range_max = item["range"]
+        inbetween_create(object, hero,
+                         target_name(item["name"], item["hero"], hero),
+                         range_min, range_max,
+                         value=item["value"],
+                         curve=item["curve"])
+        count += 1
+
+    legacy = data.get("legacy", ())
+    if legacy:
+        if not hasattr(key, "in_betweens"):
+            missing.update(item["hero"] for item in legacy)
+        else:
+            count += import_legacy(key, find, legacy, missing)
+
+    return count, sorted(missing)
+
+
+def import_legacy(key: 'Key',
+                  find: Callable[[str], Optional['ShapeKey']],
+                  items: List[Dict[str, Any]],
+                  missing: Set[str]) -> int:
+    groups: Dict[str, Tuple['ShapeKey', List[Dict[str, Any]]]] = {}
+    for item in items:
+        hero = find(item["hero"])
+        if hero is None:
+            missing.add(item["hero"])
+        else:
+            groups.setdefault(hero.name, (hero, []))[1].append(item)
+
+    if not groups:
+        return 0
+
+    pairs = [(hero, [(item["center"], item["target"]) for item in group]) for hero, group in groups.values()]
+    created = key.in_betweens.new_many(pairs)
+    ordered = [(hero, item) for hero, group in groups.values() for item in group]
+    shapes = key.key_blocks
+
+    for inbetween, (hero, item) in zip(created, ordered):
+        activation = inbetween.activation
+        activation["range_min"], activation["range_max"] = item["range"]
+        # The setter clamps the center to the imported range and renames the shape key to match
+        activation.center = item["center"]
+
+        # Keep the exported name where it is free
+        name = target_name(item["name"], item["hero"], hero) if item.get("name") else ""
+        shape = shapes.get(inbetween.name)
+        if name and shape is not None and shape.name != name and name not in shapes:
+            shape.name = name
+            inbetween["name"] = shape.name
+
+        curve_points_assign(activation.curve.points, item["curve"])
+        inbetween.mute = item["mute"]
+        inbetween.update()
+
+    return len(created)
+
+
+def context_object(context: 'Context') -> Optional['Object']:
+    object = context.object
+    if object is not None and asks.utils.supports_shape_keys(object) and object.data.shape_keys:
+        return object
+
+
+class ExportInBetweens(bpy.types.Operator, ExportHelper):
+
+    bl_idname = "inbetweens.export"
+    bl_label = "Export In-Betweens"
+    bl_description = "Export the in-betweens of the active object to a file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".json"
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.json",
+        options={'HIDDEN'}
+        )
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return context_object(context) is not None
+
+    def execute(self, context: 'Context') -> Set[str]:
+        data = export_key(context.object.data.shape_keys)
+        with open(self.filepath, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+        self.report({'INFO'}, f'Exported {len(data["inbetweens"]) + len(data["legacy"])} in-betweens')
+        return {'FINISHED'}
+
+
+class ImportInBetweens(bpy.types.Operator, ImportHelper):
+
+    bl_idname = "inbetweens.import"
+    bl_label = "Import In-Betweens"
+    bl_description = "Recreate in-betweens from a file on the active object, matching heroes by name"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".json"
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.json",
+        options={'HIDDEN'}
+        )
+
+    @classmethod
+    def poll(cls, context: 'Context') -> bool:
+        return context_object(context) is not None
+
+    def execute(self, context: 'Context') -> Set[str]:
+        try:
+            with open(self.filepath) as file:
+                data = json.load(file)
+            count, missing = import_key(context.object, data)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+
+        if missing:
+            self.report({'WARNING'}, f'Imported {count} in-betweens. Heroes not found: {", ".join(missing)}')
+        else:
+            self.report({'INFO'}, f'Imported {count} in-betweens')
+        return {'FINISHED'}
@@ -0,0 +1,54 @@
+
+from typing import Optional, TYPE_CHECKING
+import bpy
+if TYPE_CHECKING:
+    import numpy as np
+    from bpy.types import ShapeKey
+
+# NumPy is imported by the functions that use it so that the operators can import this
+# module at registration without loading it.
+
+SEED_ITEMS = [
+    ('BASIS', "Basis", "Start from a copy of the basis shape"),
+    ('HERO', "Hero", "Start from the hero's shape scaled to the activation value"),
+    ('MIX', "Mix", "Start from the current mix of all shape keys"),
+    ]
+
+
+def seed_property() -> bpy.props.EnumProperty:
+    """Returns the seed property of the operators that add in-betweens"""
+    return bpy.props.EnumProperty(
+        name="Shape",
+        description="The shape new in-between shape keys start from",
+        items=SEED_ITEMS,
+        default='BASIS',
+        options=set()
+        )
+
+
+def shape_key_coordinates(shape: 'ShapeKey', out: Optional['np.ndarray']=None) -> 'np.ndarray':
+    """Returns the (N, 3) coordinates of shape, reading into out if given"""
+    import numpy as np
+    data = shape.data
+    if out is None:
+        out = np.empty((len(data), 3), dtype=np.float32)
+    data.foreach_get("co", out.ravel())
+    return out
+
+
+def shape_key_seed(shape: 'ShapeKey', hero: 'ShapeKey', factor: float) -> bool:
+    """Sets shape to its relative key plus the hero's delta (from the hero's relative key)
+    scaled by factor. Returns False if the shape's points have no single co attribute (e.g.
+    curves), in which case shape is left unchanged.
+    """
+    data = shape.data
+    if len(data) == 0 or data[0].rna_type.identifier != 'ShapeKeyPoint':
+        return False
+
+    co = shape_key_coordinates(hero)
+    co -= shape_key_coordinates(hero.relative_key)
+    co *= factor
+    co += shape_key_coordinates(shape.relative_key)
+    data.foreach_set("co", co.ravel())
+    shape.id_data.user.update_tag()
+    return True
@@ -0,0 +1,104 @@
+
+import json
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+_enabled = False
+_records: Dict[str, 'Record'] = {}
+
+
+class Record:
+
+    __slots__ = ("count", "total", "max", "triggers")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.triggers: Dict[str, int] = {}
+
+    def add(self, elapsed: float, trigger: str) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.triggers[trigger] = self.triggers.get(trigger, 0) + 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else 0.0,
+            "triggers": dict(self.triggers),
+            }
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(value: Optional[bool]=True) -> None:
+    global _enabled
+    _enabled = bool(value)
+
+
+def reset() -> None:
+    _records.clear()
+
+
+def record(name: str, elapsed: float, trigger: Optional[str]="") -> None:
+    if _enabled:
+        data = _records.get(name)
+        if data is None:
+            data = _records[name] = Record()
+        data.add(elapsed, trigger)
+
+
+def trigger_name(args: tuple) -> str:
+    """Names what triggered a call as "rig:item": the ID and identifier (or name) of an entity
+    or component argument, or the string arguments of a message bus callback.
+    """
+    if args:
+        item = args[0]
+        id = getattr(item, "id_data", None)
+        if id is not None:
+            name = getattr(item, "identifier", "") or getattr(item, "name", "")
+            return f'{id.name}:{name}' if name else id.name
+        return ":".join(arg for arg in args if isinstance(arg, str))
+    return ""
+
+
+def instrumented(function: Callable) -> Callable:
+    """Records call counts and timings of function while statistics are enabled"""
+    name = f'{function.__module__}.{function.__qualname__}'
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record(name, perf_counter() - start, trigger_name(args))
+
+    return wrapper
+
+
+def snapshot() -> Dict[str, Any]:
+    from .curves import bezier_cache
+    return {
+        "enabled": _enabled,
+        "functions": {name: data.as_dict() for name, data in _records.items()},
+        "bezier_cache": bezier_cache.info(),
+        }
+
+
+def to_json(filepath: Optional[str]=None, indent: Optional[int]=2) -> str:
+    """Returns the collected statistics as JSON, also writing them to filepath if given"""
+    text = json.dumps(snapshot(), indent=indent, sort_keys=True)
+    if filepath:
+        with open(filepath, "w") as file:
+            file.write(text)
+    return text